@@ -0,0 +1,164 @@
+import argparse
+import json
+import sys
+
+from aoc import days, runner, serve, utils
+from aoc.bench import scaling
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m aoc", description="Advent of Code solutions")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="solve days and report timings as JSON lines")
+    run.add_argument("year", help="a year, or all for every year")
+    run.add_argument("days", nargs="?", default="all", help="e.g. 1-15, 3,5,7-9 or all (default)")
+    run.add_argument("--part", type=int, choices=(1, 2), help="only solve this part")
+    run.add_argument("--input", help="input path, '-' for stdin or fd:N (single day only)")
+    run.add_argument("--no-memory", action="store_true", help="skip the traced rerun of each phase for peak memory")
+    run.add_argument(
+        "--top-allocations",
+        type=int,
+        default=0,
+        metavar="N",
+        help="also report the N largest allocation sites near each phase's peak (runs every phase twice)",
+    )
+    run.add_argument(
+        "--memory-budget",
+        type=runner.parse_size,
+        metavar="SIZE",
+        help="fail once a phase's peak traced memory exceeds SIZE, e.g. 64M or 2G",
+    )
+    run.add_argument("--no-cache", action="store_true", help="solve every part again instead of reusing cached answers")
+    run.add_argument(
+        "-j", "--jobs", type=int, default=1, help="solve day/part jobs on this many processes (0: one per CPU)"
+    )
+    run.add_argument(
+        "--workers",
+        type=int,
+        default=utils.WORKERS,
+        help=f"processes a day may split its input over, with --jobs 1 (0: one per CPU, default {utils.WORKERS})",
+    )
+
+    scale = commands.add_parser("scaling", help="fit solver time and memory growth on generated inputs")
+    scale.add_argument("year", help="a year, or all for every year")
+    scale.add_argument("days", nargs="?", default="all", help="e.g. 1-15, 3,5,7-9 or all (default)")
+    scale.add_argument("--part", type=int, choices=(1, 2), help="only scale this part")
+    scale.add_argument("--base", type=int, help="first generator size (default: grown until every phase takes 1ms)")
+    scale.add_argument("--factor", type=float, default=2.0, help="growth between sizes (default 2)")
+    scale.add_argument("--steps", type=int, default=8, help="number of sizes (default 8)")
+    scale.add_argument("--repeat", type=int, default=3, help="timed samples per phase and size (default 3)")
+    scale.add_argument("--seed", type=int, default=0)
+    scale.add_argument(
+        "--max-seconds", type=float, default=10.0, help="stop growing a day once one size takes longer (default 10)"
+    )
+    scale.add_argument(
+        "--threshold",
+        type=float,
+        default=scaling.FLAG_EXPONENT,
+        help=f"flag phases growing faster than n^threshold (default {scaling.FLAG_EXPONENT})",
+    )
+    scale.add_argument("--no-memory", action="store_true", help="skip tracemalloc peak memory tracking")
+    scale.add_argument("-o", "--output", help="also write the measurements and fits to this JSON file")
+
+    daemon = commands.add_parser("serve", help="answer solve requests on a Unix socket from preloaded workers")
+    daemon.add_argument("--socket", default=serve.SOCKET_PATH, help=f"socket path (default {serve.SOCKET_PATH})")
+    daemon.add_argument("-j", "--jobs", type=int, default=0, help="worker processes (default 0: one per CPU)")
+    daemon.add_argument("--no-cache", action="store_true", help="solve every request instead of reusing cached answers")
+
+    ask = commands.add_parser("ask", help="solve a day/part on a running aoc serve")
+    ask.add_argument("year", type=int)
+    ask.add_argument("day", type=int)
+    ask.add_argument("part", type=int, choices=(1, 2))
+    ask.add_argument("--input", default="-", help="input path, '-' for stdin (default) or fd:N")
+    ask.add_argument("--socket", default=serve.SOCKET_PATH, help=f"socket path (default {serve.SOCKET_PATH})")
+
+    return parser.parse_args(argv)
+
+
+def run(args):
+    try:
+        selected = days.select(args.year, args.days)
+    except ValueError as error:
+        raise SystemExit(error)
+    parts = (args.part,) if args.part else (1, 2)
+
+    filepath = None
+    if args.input is not None:
+        if len(selected) != 1:
+            raise SystemExit("--input needs a single day")
+        filepath = utils.input_arg(args.input)
+    if args.no_memory and args.memory_budget is not None:
+        raise SystemExit("--memory-budget needs memory tracking")
+    if args.workers != 1 and args.jobs != 1:
+        raise SystemExit("--workers needs --jobs 1")
+    utils.WORKERS = args.workers
+
+    options = {"trace_memory": not args.no_memory, "top_allocations": args.top_allocations, "cache": not args.no_cache}
+    if args.jobs == 1:
+        measurements = (
+            measurement
+            for year, day in selected
+            for measurement in runner.run_day(year, day, parts, filepath, **options)
+        )
+    else:
+        jobs = [(year, day, part) for year, day in selected for part in parts]
+        measurements = runner.run_parallel(jobs, args.jobs or None, filepath, **options)
+
+    try:
+        for measurement in runner.enforce_budget(measurements, args.memory_budget):
+            print(json.dumps(measurement.to_dict(), default=str), flush=True)
+    except runner.MemoryBudgetExceeded as error:
+        raise SystemExit(error)
+
+
+def scale(args):
+    try:
+        selected = days.select(args.year, args.days)
+    except ValueError as error:
+        raise SystemExit(error)
+
+    results = scaling.run(
+        selected,
+        (args.part,) if args.part else (1, 2),
+        factor=args.factor,
+        steps=args.steps,
+        base=args.base,
+        threshold=args.threshold,
+        repeat=args.repeat,
+        trace_memory=not args.no_memory,
+        max_seconds=args.max_seconds,
+        seed=args.seed,
+    )
+    print(scaling.format_report(results))
+    if args.output:
+        with open(args.output, "w") as file_:
+            json.dump(results, file_, indent=2)
+
+
+def ask(args):
+    data = utils.read_bytes(utils.input_arg(args.input))
+    try:
+        with serve.Client(args.socket) as client:
+            response = client.solve(args.year, args.day, args.part, data)
+    except OSError as error:
+        raise SystemExit(f"cannot reach aoc serve on {args.socket}: {error}")
+    print(json.dumps(response))
+    if "error" in response:
+        sys.exit(1)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.command == "run":
+        run(args)
+    elif args.command == "scaling":
+        scale(args)
+    elif args.command == "serve":
+        serve.serve(args.socket, args.jobs or None, cache=not args.no_cache)
+    elif args.command == "ask":
+        ask(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""On-disk cache of answers and their timings, one file per day, phase and input.
+
+An entry is keyed by the day, the phase, the content hash of the input and
+the source hash of the day's module (and of ``aoc.utils``, which parses most
+inputs), so editing either the solver or the input misses the cache. Each
+hit refreshes the entry's modification time and the least recently used
+entries are evicted once the cache grows past ``MAX_BYTES``.
+"""
+import hashlib
+import os
+import pickle
+from typing import Any, Dict, Optional
+
+from aoc import utils
+
+ANSWERS_PATH = utils.CACHE_PATH / "answers"
+
+MAX_BYTES = 4 << 20
+
+
+def answer_key(year: int, day: int, phase: str, code_digest: str, input_digest: str) -> str:
+    return hashlib.sha256(f"{year}/{day:02d}/{phase}:{code_digest}:{input_digest}".encode()).hexdigest()
+
+
+def load(key: str) -> Optional[Dict[str, Any]]:
+    cache_file = ANSWERS_PATH / f"{key}.pickle"
+    try:
+        with open(cache_file, "rb") as file_:
+            entry = pickle.load(file_)
+        os.utime(cache_file)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return None
+    return entry
+
+
+def store(key: str, entry: Dict[str, Any]) -> None:
+    ANSWERS_PATH.mkdir(parents=True, exist_ok=True)
+    cache_file = ANSWERS_PATH / f"{key}.pickle"
+    partial_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        with open(partial_file, "wb") as file_:
+            pickle.dump(entry, file_, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        os.remove(partial_file)
+        return
+    os.replace(partial_file, cache_file)
+
+
+def evict(max_bytes: int = MAX_BYTES) -> int:
+    """Delete least recently used entries until the cache fits in ``max_bytes``; return how many went."""
+    return utils.evict_lru(ANSWERS_PATH, max_bytes)
@@ -0,0 +1,130 @@
+import contextlib
+import datetime
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+from aoc import days, utils
+from aoc.runner import PHASES
+
+MIN_SAMPLE_SECONDS = 0.01
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of ``samples``."""
+    ordered = sorted(samples)
+    rank = max(math.ceil(fraction * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "p95": percentile(samples, 0.95),
+        "mean": statistics.mean(samples),
+    }
+
+
+def calibrate(func: Callable, *args: Any) -> int:
+    """Number of calls per sample so that fast phases still take ``MIN_SAMPLE_SECONDS``."""
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func(*args)
+        elapsed = time.perf_counter() - start
+        if elapsed >= MIN_SAMPLE_SECONDS:
+            return loops
+        loops *= 10 if elapsed < MIN_SAMPLE_SECONDS / 10 else 2
+
+
+def time_phase(func: Callable, *args: Any, warmup: int = 1, repeat: int = 5) -> Dict[str, Any]:
+    """Time ``func(*args)``: ``warmup`` discarded samples, then ``repeat`` recorded ones.
+
+    Each sample is the mean over ``loops`` calls, chosen so that even
+    sub-millisecond phases are measured well above timer resolution. The
+    calibration calls count as the first warmup.
+    """
+    loops = calibrate(func, *args)
+    warmup = max(warmup - 1, 0)
+    samples = []
+    for index in range(warmup + repeat):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func(*args)
+        elapsed = (time.perf_counter() - start) / loops
+        if index >= warmup:
+            samples.append(elapsed)
+    return {"loops": loops, "samples": samples, **summarize(samples)}
+
+
+def bench_day(
+    year: int,
+    day: int,
+    parts: Iterable[int] = (1, 2),
+    warmup: int = 1,
+    repeat: int = 5,
+    filepath: Any = None,
+) -> Dict[str, Any]:
+    solution = days.load(year, day)
+    filepath = solution.filepath if filepath is None else filepath
+    # Keep the input in memory so the samples measure the solver, not the disk.
+    with utils.held_input(filepath), contextlib.redirect_stdout(sys.stderr):
+        phases = {"parse": time_phase(solution.parse, filepath, warmup=warmup, repeat=repeat)}
+        model = solution.parse(filepath)
+        for part in parts:
+            phases[PHASES[part]] = time_phase(solution.part(part), model, warmup=warmup, repeat=repeat)
+    return {"year": year, "day": day, "phases": phases}
+
+
+def run(
+    selected: Iterable[Tuple[int, int]],
+    parts: Iterable[int] = (1, 2),
+    warmup: int = 1,
+    repeat: int = 5,
+    filepath: Any = None,
+) -> Dict[str, Any]:
+    """Benchmark each ``(year, day)`` in ``selected``.
+
+    The parse cache is bypassed so that the parse phase measures parsing.
+    """
+    parse_cache = utils.PARSE_CACHE
+    utils.PARSE_CACHE = False
+    try:
+        results = [bench_day(year, day, parts, warmup, repeat, filepath) for year, day in selected]
+    finally:
+        utils.PARSE_CACHE = parse_cache
+    return {
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": sys.version,
+        "platform": platform.platform(),
+        "warmup": warmup,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def save(report: Dict[str, Any], path: str) -> None:
+    with open(path, "w") as file_:
+        json.dump(report, file_, indent=2)
+
+
+def load(path: str) -> Dict[str, Any]:
+    with open(path) as file_:
+        return json.load(file_)
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    lines = [f"{'day':<8}{'phase':<10}{'loops':>8}{'min':>12}{'median':>12}{'p95':>12}"]
+    for result in report["results"]:
+        for phase, stats in result["phases"].items():
+            lines.append(
+                f"{result['year']}/{result['day']:02d} {phase:<10}{stats['loops']:>8}"
+                f"{stats['min'] * 1000:>10.3f}ms{stats['median'] * 1000:>10.3f}ms{stats['p95'] * 1000:>10.3f}ms"
+            )
+    return "\n".join(lines)
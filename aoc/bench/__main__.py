@@ -0,0 +1,77 @@
+import argparse
+
+from aoc import bench, days, utils
+from aoc.bench import regress
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m aoc.bench", description="Benchmark day solutions")
+    parser.add_argument("year", nargs="?", default="all", help="a year, or all (default) for every year")
+    parser.add_argument("days", nargs="?", default="all", help="e.g. 1-15, 3,5,7-9 or all (default)")
+    parser.add_argument("--part", type=int, choices=(1, 2), help="only benchmark this part")
+    parser.add_argument("--warmup", type=int, default=1, help="discarded samples per phase (default 1)")
+    parser.add_argument("--repeat", type=int, default=5, help="recorded samples per phase (default 5)")
+    parser.add_argument("--input", help="input path, '-' for stdin or fd:N (single day only)")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=utils.WORKERS,
+        help=f"processes a day may split its input over (0: one per CPU, default {utils.WORKERS})",
+    )
+    parser.add_argument("-o", "--output", help="write the full results, including samples, to this JSON file")
+    parser.add_argument(
+        "--compare", metavar="BASELINE", help="compare against a report saved with -o and fail on regressions"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=regress.DEFAULT_THRESHOLD,
+        help=f"slowdown of the median that counts as a regression (default {regress.DEFAULT_THRESHOLD})",
+    )
+    parser.add_argument("--thresholds", help='JSON file of per-solver thresholds, e.g. {"2021/15": 0.1}')
+    parser.add_argument(
+        "--alpha", type=float, default=regress.ALPHA, help=f"significance level of the test (default {regress.ALPHA})"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    try:
+        selected = days.select(args.year, args.days)
+    except ValueError as error:
+        raise SystemExit(error)
+
+    filepath = None
+    if args.input is not None:
+        if len(selected) != 1:
+            raise SystemExit("--input needs a single day")
+        filepath = utils.input_arg(args.input)
+    utils.WORKERS = args.workers
+
+    baseline = None
+    if args.compare is not None:
+        baseline = bench.load(args.compare)
+        if args.year == "all" and args.days == "all":
+            # Time what the baseline timed rather than every day there is.
+            selected = [(result["year"], result["day"]) for result in baseline["results"]]
+
+    parts = (args.part,) if args.part else (1, 2)
+    report = bench.run(selected, parts, args.warmup, args.repeat, filepath)
+    print(bench.format_report(report))
+    if args.output:
+        bench.save(report, args.output)
+
+    if baseline is not None:
+        comparisons = regress.compare(
+            baseline, report, regress.load_thresholds(args.thresholds), args.threshold, args.alpha
+        )
+        print()
+        print(regress.format_comparison(comparisons))
+        regressed = regress.regressions(comparisons)
+        if regressed:
+            raise SystemExit(f"{len(regressed)} phase(s) regressed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Hashes per second of the 2015/04 nonce search, against the naive loop it replaced.
+
+``python -m aoc.bench.md5`` times both over the same nonces with a prefix
+no hash has, so every nonce is hashed, and prints the median rate of each.
+The naive loop hashes the key and a formatted nonce from scratch and
+compares the start of ``hexdigest()``, as the day did before reusing the
+key's MD5 state.
+"""
+import argparse
+import hashlib
+import importlib
+from typing import Any, Dict, Optional
+
+from aoc import days
+from aoc.bench import time_phase
+
+KEY = "abcdefgh"
+START = 1_000_000
+COUNT = 1 << 16
+# More zeroes than an MD5 digest has nibbles: no nonce ever matches.
+ZEROES = 33
+
+
+def naive_search(key: str, zeroes: int, start: int, stop: int) -> Optional[int]:
+    prefix = "0" * zeroes
+    for nonce in range(start, stop):
+        if hashlib.md5(f"{key}{nonce}".encode()).hexdigest()[:zeroes] == prefix:
+            return nonce
+    return None
+
+
+def run(key: str = KEY, start: int = START, count: int = COUNT, repeat: int = 5) -> Dict[str, Any]:
+    engines = {"naive": naive_search, "engine": importlib.import_module(days.module_name(2015, 4)).search}
+    results = {}
+    for name, func in engines.items():
+        timing = time_phase(func, key, ZEROES, start, start + count, repeat=repeat)
+        results[name] = {**timing, "hashes_per_second": count / timing["median"]}
+    return {"key": key, "start": start, "count": count, "engines": results}
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    engines = report["engines"]
+    lines = [f"{'engine':<8}{'median':>12}{'hashes/s':>14}"]
+    for name, result in engines.items():
+        lines.append(f"{name:<8}{result['median'] * 1000:>10.3f}ms{result['hashes_per_second']:>14,.0f}")
+    speedup = engines["engine"]["hashes_per_second"] / engines["naive"]["hashes_per_second"]
+    lines.append(f"speedup {speedup:.2f}x over {report['count']} nonces from {report['start']}")
+    return "\n".join(lines)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m aoc.bench.md5", description="Benchmark 2015/04 MD5 hashing")
+    parser.add_argument("--key", default=KEY, help=f"secret key (default {KEY})")
+    parser.add_argument("--start", type=int, default=START, help=f"first nonce (default {START})")
+    parser.add_argument("--count", type=int, default=COUNT, help=f"nonces per sample (default {COUNT})")
+    parser.add_argument("--repeat", type=int, default=5, help="recorded samples (default 5)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    print(format_report(run(args.key, args.start, args.count, args.repeat)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Compare a benchmark report against a baseline report and flag regressions.
+
+A phase regresses when its median time grew by more than its threshold and
+a one-sided Mann-Whitney U test says the new samples are slower than the
+baseline ones with p at most ``alpha``. The test looks only at the order of
+the samples, so one disturbed sample cannot fail the gate on its own, and a
+large jump measured on too few samples is reported but not failed.
+
+Thresholds are relative slowdowns, ``0.25`` meaning 25% slower. A thresholds
+file maps ``"2021/15"`` or ``"2021/15/part_two"`` to a threshold, the most
+specific entry winning over ``DEFAULT_THRESHOLD``.
+"""
+import functools
+import json
+import math
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_THRESHOLD = 0.25
+ALPHA = 0.05
+
+EXACT_LIMIT = 400
+
+
+@functools.lru_cache(maxsize=None)
+def u_counts(n: int, m: int) -> Tuple[int, ...]:
+    """How many orderings of ``n`` and ``m`` distinct samples give each value of U, from 0 to ``n * m``."""
+    if n == 0 or m == 0:
+        return (1,)
+    counts = [0] * (n * m + 1)
+    # The largest sample either comes from the first group, beating all m others, or from the second.
+    for u, count in enumerate(u_counts(n - 1, m)):
+        counts[u + m] += count
+    for u, count in enumerate(u_counts(n, m - 1)):
+        counts[u] += count
+    return tuple(counts)
+
+
+def mann_whitney(before: List[float], after: List[float]) -> float:
+    """One-sided p-value of ``after`` tending to be larger than ``before``.
+
+    Exact for small samples without ties, otherwise the normal
+    approximation with a tie and continuity correction.
+    """
+    n, m = len(after), len(before)
+    u = sum((a > b) + 0.5 * (a == b) for a in after for b in before)
+    pooled = after + before
+    ties = [pooled.count(value) for value in set(pooled)]
+    if n * m <= EXACT_LIMIT and len(ties) == len(pooled):
+        counts = u_counts(n, m)
+        return sum(counts[math.ceil(u) :]) / math.comb(n + m, n)
+
+    total = n + m
+    tie_correction = sum(t ** 3 - t for t in ties) / (total * (total - 1))
+    variance = n * m / 12 * (total + 1 - tie_correction)
+    if variance == 0:
+        return 1.0
+    z = (u - n * m / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def load_thresholds(path: Optional[str]) -> Dict[str, float]:
+    if path is None:
+        return {}
+    with open(path) as file_:
+        return {key: float(value) for key, value in json.load(file_).items()}
+
+
+def threshold_for(thresholds: Dict[str, float], year: int, day: int, phase: str, default: float) -> float:
+    for key in (f"{year}/{day:02d}/{phase}", f"{year}/{day:02d}"):
+        if key in thresholds:
+            return thresholds[key]
+    return default
+
+
+def compare(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    thresholds: Optional[Dict[str, float]] = None,
+    default: float = DEFAULT_THRESHOLD,
+    alpha: float = ALPHA,
+) -> List[Dict[str, Any]]:
+    """One comparison per phase of ``current``, with a ``status`` of ok, regressed, improved, noisy or new.
+
+    ``noisy`` is a median beyond the threshold that the test does not back up.
+    """
+    thresholds = thresholds or {}
+    before = {(result["year"], result["day"]): result["phases"] for result in baseline["results"]}
+    comparisons = []
+    for result in current["results"]:
+        year, day = result["year"], result["day"]
+        for phase, stats in result["phases"].items():
+            threshold = threshold_for(thresholds, year, day, phase, default)
+            comparison = {
+                "year": year,
+                "day": day,
+                "phase": phase,
+                "threshold": threshold,
+                "baseline": None,
+                "median": stats["median"],
+                "ratio": None,
+                "p_slower": None,
+                "p_faster": None,
+                "status": "new",
+            }
+            old = before.get((year, day), {}).get(phase)
+            if old is not None:
+                ratio = stats["median"] / old["median"] if old["median"] else math.inf
+                p_slower = mann_whitney(old["samples"], stats["samples"])
+                p_faster = mann_whitney(stats["samples"], old["samples"])
+                if ratio > 1 + threshold:
+                    status = "regressed" if p_slower <= alpha else "noisy"
+                elif ratio < 1 / (1 + threshold) and p_faster <= alpha:
+                    status = "improved"
+                else:
+                    status = "ok"
+                comparison.update(
+                    baseline=old["median"], ratio=ratio, p_slower=p_slower, p_faster=p_faster, status=status
+                )
+            comparisons.append(comparison)
+    return comparisons
+
+
+def regressions(comparisons: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [comparison for comparison in comparisons if comparison["status"] == "regressed"]
+
+
+def format_comparison(comparisons: List[Dict[str, Any]]) -> str:
+    lines = [f"{'day':<8}{'phase':<10}{'baseline':>12}{'median':>12}{'change':>9}{'p':>8}  status"]
+    for comparison in comparisons:
+        baseline = comparison["baseline"]
+        if baseline is None:
+            before, change, p = "-", "-", "-"
+        else:
+            before = f"{baseline * 1000:.3f}ms"
+            change = f"{(comparison['ratio'] - 1) * 100:+.1f}%"
+            p = f"{min(comparison['p_slower'], comparison['p_faster']):.3f}"
+        lines.append(
+            f"{comparison['year']}/{comparison['day']:02d} {comparison['phase']:<10}{before:>12}"
+            f"{comparison['median'] * 1000:>10.3f}ms{change:>9}{p:>8}  {comparison['status']}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,256 @@
+"""Empirical complexity: time and memory of each phase across generated input sizes.
+
+Inputs come from ``aoc.gen`` at a geometric series of sizes and growth is
+measured against the input size in bytes, so a ``n x n`` grid whose solver is
+linear in its cells fits ``n``, not ``n^2``.
+
+Sub-millisecond phases are dominated by noise and fixed overheads, so the
+series starts from a size at which every phase takes ``MIN_PHASE_SECONDS``
+and times below it are left out of the fits.
+"""
+import contextlib
+import math
+import sys
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from aoc import days, gen, utils
+from aoc.bench import time_phase
+from aoc.runner import PHASES, peak_memory
+
+FLAG_EXPONENT = 1.25
+MIN_PHASE_SECONDS = 0.001
+# Growing the first size stops once a phase is this slow, in case another one never gets slower at all.
+MAX_START_SECONDS = 0.05
+MIN_FIT_POINTS = 3
+
+MODELS: Dict[str, Callable[[float], float]] = {
+    "1": lambda n: 1.0,
+    "log n": math.log,
+    "n": lambda n: n,
+    "n log n": lambda n: n * math.log(n),
+    "n^1.5": lambda n: n ** 1.5,
+    "n^2": lambda n: n ** 2,
+    "n^2 log n": lambda n: n ** 2 * math.log(n),
+    "n^3": lambda n: n ** 3,
+}
+
+
+def geometric_sizes(base: int, factor: float, steps: int) -> List[int]:
+    return sorted({max(round(base * factor ** step), 1) for step in range(steps)})
+
+
+def fit_exponent(sizes: List[float], values: List[float]) -> Optional[float]:
+    """Slope of the least-squares line through ``(log size, log value)``: ``value ~ size^slope``."""
+    points = [(math.log(size), math.log(value)) for size, value in zip(sizes, values) if size > 0 and value > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    if spread == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+
+
+def best_model(sizes: List[float], values: List[float]) -> Optional[str]:
+    """The model ``value = c * f(size)`` from ``MODELS`` with the smallest squared log error."""
+    points = [(size, value) for size, value in zip(sizes, values) if size > 1 and value > 0]
+    if len(points) < 2:
+        return None
+
+    def error(model: Callable[[float], float]) -> float:
+        residuals = [math.log(value) - math.log(model(size)) for size, value in points]
+        mean = sum(residuals) / len(residuals)
+        return sum((residual - mean) ** 2 for residual in residuals)
+
+    return min(MODELS, key=lambda name: error(MODELS[name]))
+
+
+def phase_funcs(solution: days.Day, parts: Iterable[int]) -> Dict[str, Callable]:
+    funcs = {PHASES[part]: solution.part(part) for part in parts}
+    if solution.parse is not days.identity:
+        funcs = {"parse": solution.parse, **funcs}
+    return funcs
+
+
+def starting_size(
+    year: int,
+    day: int,
+    base: int,
+    parts: Iterable[int] = (1, 2),
+    min_seconds: float = MIN_PHASE_SECONDS,
+    seed: int = 0,
+) -> int:
+    """Double ``base`` until every phase takes at least ``min_seconds``, or one takes ``MAX_START_SECONDS``."""
+    solution = days.load(year, day)
+    funcs = phase_funcs(solution, parts)
+    size = base
+    while True:
+        path = gen.register(year, day, size, seed)
+        try:
+            with contextlib.redirect_stdout(sys.stderr):
+                model = solution.parse(path)
+                seconds = []
+                for phase, func in funcs.items():
+                    start = time.perf_counter()
+                    func(path if phase == "parse" else model)
+                    seconds.append(time.perf_counter() - start)
+        except Exception:
+            # scale_day records the failure; start from the last size that worked.
+            return max(size // 2, base)
+        finally:
+            utils.unregister_input(path)
+        if min(seconds) >= min_seconds or max(seconds) >= MAX_START_SECONDS:
+            return size
+        size *= 2
+
+
+def scale_day(
+    year: int,
+    day: int,
+    sizes: Iterable[int],
+    parts: Iterable[int] = (1, 2),
+    repeat: int = 3,
+    trace_memory: bool = True,
+    max_seconds: float = 10.0,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """Measure each phase of a day on generated inputs of increasing size.
+
+    Each time is the fastest of ``repeat`` samples, the one least disturbed
+    by whatever else the machine is doing.
+
+    The series stops early once one size takes longer than ``max_seconds``,
+    or when the solver fails, e.g. by exhausting the recursion limit; the
+    error is recorded with the size that caused it.
+    """
+    solution = days.load(year, day)
+    funcs = phase_funcs(solution, parts)
+
+    result = {"year": year, "day": day, "sizes": [], "bytes": [], "phases": {}, "error": None}
+    for phase in funcs:
+        result["phases"][phase] = {"seconds": [], "peak_bytes": []}
+
+    for size in sizes:
+        path = gen.register(year, day, size, seed)
+        length = len(utils.registered_input(path))
+        start = time.perf_counter()
+        try:
+            with contextlib.redirect_stdout(sys.stderr):
+                model = solution.parse(path)
+                timings = {}
+                for phase, func in funcs.items():
+                    arg = path if phase == "parse" else model
+                    seconds = time_phase(func, arg, warmup=1, repeat=repeat)["min"]
+                    peak = peak_memory(func, arg) if trace_memory else None
+                    timings[phase] = (seconds, peak)
+        except Exception as error:
+            result["error"] = f"size {size}: {type(error).__name__}: {error}"
+            break
+        finally:
+            utils.unregister_input(path)
+
+        result["sizes"].append(size)
+        result["bytes"].append(length)
+        for phase, (seconds, peak) in timings.items():
+            result["phases"][phase]["seconds"].append(seconds)
+            result["phases"][phase]["peak_bytes"].append(peak)
+        if time.perf_counter() - start > max_seconds:
+            break
+    return result
+
+
+def fit_points(sizes: List[int], values: List[float], floor: float) -> Tuple[List[int], List[float]]:
+    """The points with a value of at least ``floor``, or the ``MIN_FIT_POINTS`` largest sizes if too few are."""
+    points = [(size, value) for size, value in zip(sizes, values) if value >= floor]
+    if len(points) < MIN_FIT_POINTS:
+        points = list(zip(sizes, values))[-MIN_FIT_POINTS:]
+    return [size for size, _ in points], [value for _, value in points]
+
+
+def analyse(
+    result: Dict[str, Any], threshold: float = FLAG_EXPONENT, min_seconds: float = MIN_PHASE_SECONDS
+) -> Dict[str, Dict[str, Any]]:
+    """Fitted exponent and best model of time and memory for each phase.
+
+    Times are fitted over the sizes where the phase took at least
+    ``min_seconds``, memory over every size; leaving out the faster times
+    keeps noise out of the slope. A phase is flagged when either exponent
+    exceeds ``threshold``, whichever model fits best.
+    """
+    analysis = {}
+    for phase, series in result["phases"].items():
+        fits = {"flagged": []}
+        for metric, values, floor in (
+            ("time", series["seconds"], min_seconds),
+            ("memory", series["peak_bytes"], 0),
+        ):
+            if None in values:
+                fits[f"{metric}_exponent"] = fits[f"{metric}_model"] = None
+                continue
+            sizes, values = fit_points(result["bytes"], values, floor)
+            exponent = fit_exponent(sizes, values)
+            model = best_model(sizes, values)
+            fits[f"{metric}_exponent"] = exponent
+            fits[f"{metric}_model"] = model
+            if exponent is not None and exponent > threshold:
+                fits["flagged"].append(metric)
+        analysis[phase] = fits
+    return analysis
+
+
+def run(
+    selected: Iterable,
+    parts: Iterable[int] = (1, 2),
+    factor: float = 2.0,
+    steps: int = 8,
+    base: Optional[int] = None,
+    threshold: float = FLAG_EXPONENT,
+    **options: Any,
+) -> List[Dict[str, Any]]:
+    """Scale every selected day that has a generator; ``options`` go to ``scale_day``.
+
+    Without a ``base`` each day starts from ``starting_size``.
+    """
+    parse_cache = utils.PARSE_CACHE
+    utils.PARSE_CACHE = False
+    try:
+        results = []
+        for year, day in selected:
+            if (year, day) not in gen.GENERATORS:
+                continue
+            first = base or starting_size(year, day, gen.BASE_SIZES[(year, day)], parts, seed=options.get("seed", 0))
+            sizes = geometric_sizes(first, factor, steps)
+            result = scale_day(year, day, sizes, parts, **options)
+            result["analysis"] = analyse(result, threshold)
+            results.append(result)
+        return results
+    finally:
+        utils.PARSE_CACHE = parse_cache
+
+
+def format_exponent(exponent: Optional[float], model: Optional[str]) -> str:
+    if exponent is None:
+        return "-"
+    return f"n^{exponent:.2f} ({model})"
+
+
+def format_report(results: List[Dict[str, Any]]) -> str:
+    lines = []
+    for result in results:
+        phases = list(result["phases"])
+        lines.append(f"{result['year']}/{result['day']:02d}")
+        lines.append(f"  {'size':>8}{'bytes':>12}" + "".join(f"{phase:>14}" for phase in phases))
+        for index, (size, length) in enumerate(zip(result["sizes"], result["bytes"])):
+            seconds = "".join(f"{result['phases'][phase]['seconds'][index] * 1000:>12.3f}ms" for phase in phases)
+            lines.append(f"  {size:>8}{length:>12}{seconds}")
+        for phase, fits in result["analysis"].items():
+            flag = f"  <- superlinear {' and '.join(fits['flagged'])}" if fits["flagged"] else ""
+            lines.append(
+                f"  {phase:<10} time {format_exponent(fits['time_exponent'], fits['time_model']):<22}"
+                f" memory {format_exponent(fits['memory_exponent'], fits['memory_model']):<22}{flag}"
+            )
+        if result["error"]:
+            lines.append(f"  stopped at {result['error']}")
+    return "\n".join(lines)
@@ -0,0 +1,77 @@
+import importlib
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+from aoc import utils
+
+YEARS_PATH = utils.CURRENT_PATH / "aoc" / "year"
+
+
+def identity(value: Any) -> Any:
+    return value
+
+
+@dataclass(frozen=True)
+class Day:
+    """How to solve a day: its default input and how to turn it into answers.
+
+    ``parse`` receives an input path and returns the model both parts share;
+    days whose parts read their own input keep the default and receive the path.
+    Raw bytes are solved by registering them with ``utils.register_input``
+    under a name and passing that name as the path. Parts must not modify
+    the model, so that it can be reused across parts and timing runs.
+    """
+
+    filepath: str
+    part_one: Callable[[Any], Any]
+    part_two: Callable[[Any], Any]
+    parse: Callable[[str], Any] = identity
+
+    def part(self, number: int) -> Callable[[Any], Any]:
+        return self.part_one if number == 1 else self.part_two
+
+    def solve(self, filepath: Optional[str] = None, parts: Iterable[int] = (1, 2)) -> Tuple[Any, ...]:
+        """Parse ``filepath`` (the day's own input by default) once and solve each of ``parts`` from it."""
+        model = self.parse(self.filepath if filepath is None else filepath)
+        return tuple(self.part(part)(model) for part in parts)
+
+
+def module_name(year: int, day: int) -> str:
+    return f"aoc.year.{year}.{day:02d}"
+
+
+def load(year: int, day: int) -> Day:
+    return importlib.import_module(module_name(year, day)).DAY
+
+
+def available_years() -> List[int]:
+    return sorted(int(path.name) for path in YEARS_PATH.iterdir() if path.name.isdigit())
+
+
+def available_days(year: int) -> List[int]:
+    return sorted(int(path.stem) for path in (YEARS_PATH / str(year)).glob("[0-9]*.py"))
+
+
+def parse_days(spec: str, year: int) -> List[int]:
+    """Expand a day selection such as ``1-15``, ``3,5,7-9`` or ``all``."""
+    available = available_days(year)
+    if spec == "all":
+        return available
+
+    selected = []
+    for part in spec.split(","):
+        start, _, end = part.partition("-")
+        for day in range(int(start), int(end or start) + 1):
+            if day not in available:
+                raise ValueError(f"{year} day {day} does not exist")
+            selected.append(day)
+    return selected
+
+
+def select(year: str, spec: str = "all") -> List[Tuple[int, int]]:
+    """``(year, day)`` pairs for a year (or ``all`` years) and a day selection."""
+    if year == "all":
+        if spec != "all":
+            raise ValueError("selecting days needs a single year")
+        return [(year, day) for year in available_years() for day in available_days(year)]
+    return [(int(year), day) for day in parse_days(spec, int(year))]
@@ -0,0 +1,488 @@
+"""Seeded synthetic puzzle inputs of arbitrary size.
+
+Every generator takes a size ``n`` and a ``random.Random`` and returns the
+text of a valid input for its day, so the same ``(year, day, n, seed)`` always
+produces the same bytes. What ``n`` counts depends on the puzzle; it is the
+quantity the solvers scale with and is documented on each generator.
+"""
+import argparse
+import itertools
+import math
+import random
+import string
+import sys
+from typing import Callable, Dict, List, Tuple
+
+from aoc import utils
+
+Generator = Callable[[int, random.Random], str]
+
+GENERATORS: Dict[Tuple[int, int], Generator] = {}
+
+BASE_SIZES: Dict[Tuple[int, int], int] = {}
+
+SEGMENTS = ("abcefg", "cf", "acdeg", "acdfg", "bcdf", "abdfg", "abdefg", "acf", "abcdefg", "abcdfg")
+
+ROW_LETTERS = str.maketrans("01", "FB")
+COLUMN_LETTERS = str.maketrans("01", "LR")
+
+BRACKETS = {"(": ")", "[": "]", "{": "}", "<": ">"}
+
+ADJECTIVES = ("bright", "clear", "dark", "dim", "dotted", "drab", "dull", "faded", "light", "mirrored", "muted", "pale")
+COLORS = ("aqua", "beige", "black", "blue", "bronze", "coral", "crimson", "cyan", "fuchsia", "gold", "gray", "green")
+
+
+def generator(year: int, day: int, base_size: int = 100) -> Callable[[Generator], Generator]:
+    """Register a generator; ``base_size`` is a size small enough to solve in a blink."""
+
+    def register(func: Generator) -> Generator:
+        GENERATORS[(year, day)] = func
+        BASE_SIZES[(year, day)] = base_size
+        return func
+
+    return register
+
+
+def generate(year: int, day: int, n: int, seed: int = 0) -> bytes:
+    try:
+        func = GENERATORS[(year, day)]
+    except KeyError:
+        raise ValueError(f"no generator for {year} day {day}") from None
+    return func(n, random.Random(f"{year}/{day}/{seed}")).encode()
+
+
+def input_name(year: int, day: int, n: int, seed: int = 0) -> str:
+    return f"gen/{year}/{day:02d}-{n}-{seed}.txt"
+
+
+def register(year: int, day: int, n: int, seed: int = 0) -> str:
+    """Generate an input into the in-memory registry and return the path that serves it."""
+    path = input_name(year, day, n, seed)
+    utils.register_input(path, generate(year, day, n, seed))
+    return path
+
+
+def lines(values) -> str:
+    return "\n".join(values) + "\n"
+
+
+def word(index: int, alphabet: str = string.ascii_lowercase) -> str:
+    """A distinct name for every index: a, b, ..., z, ba, bb, ..."""
+    letters = alphabet[index % len(alphabet)]
+    index //= len(alphabet)
+    while index:
+        letters = alphabet[index % len(alphabet)] + letters
+        index //= len(alphabet)
+    return letters
+
+
+def digit_grid(n: int, rng: random.Random, digits: str) -> str:
+    return lines("".join(rng.choices(digits, k=n)) for _ in range(n))
+
+
+@generator(2015, 1)
+def floor_directions(n: int, rng: random.Random) -> str:
+    """``n`` parentheses that first reach the basement on the last (odd numbered) one."""
+    entry = n if n % 2 else n - 1
+    floor = 0
+    chars = []
+    for remaining in range(entry, 0, -1):
+        if remaining <= floor + 1:
+            char = ")"
+        elif floor == 0:
+            char = "("
+        else:
+            char = rng.choice("()")
+        floor += 1 if char == "(" else -1
+        chars.append(char)
+    return "".join(chars) + "(" * (n - entry)
+
+
+@generator(2015, 2)
+def present_dimensions(n: int, rng: random.Random) -> str:
+    """``n`` presents."""
+    return lines(f"{rng.randint(1, 30)}x{rng.randint(1, 30)}x{rng.randint(1, 30)}" for _ in range(n))
+
+
+@generator(2015, 3)
+def delivery_moves(n: int, rng: random.Random) -> str:
+    """``n`` moves."""
+    return "".join(rng.choices("^v<>", k=n))
+
+
+@generator(2015, 4, base_size=4)
+def secret_key(n: int, rng: random.Random) -> str:
+    """A secret key of ``n`` letters; the nonce search itself does not grow with the input."""
+    return "".join(rng.choices(string.ascii_lowercase, k=n)) + "\n"
+
+
+@generator(2015, 5)
+def naughty_or_nice(n: int, rng: random.Random) -> str:
+    """``n`` strings of 16 letters."""
+    return lines("".join(rng.choices(string.ascii_lowercase, k=16)) for _ in range(n))
+
+
+@generator(2020, 1)
+def expense_report(n: int, rng: random.Random) -> str:
+    """``n`` entries with exactly one pair and one triple summing to 2020.
+
+    Four small entries carry the answers; every filler entry is above 1010
+    and avoids the values that would complete 2020 with the small ones.
+    """
+    while True:
+        second, third = rng.randint(700, 1000), rng.randint(700, 1000)
+        small = [rng.randint(100, 400), second, third, 2020 - second - third]
+        if sum(small[:3]) != 2020:
+            break
+    taken = {2020 - value for value in small}
+    taken.update(2020 - first - second for first, second in itertools.combinations(small, 2))
+    filler = [value for value in range(1011, 2020) if value not in taken]
+    entries = small + [2020 - small[0]] + rng.choices(filler, k=max(n - 5, 0))
+    rng.shuffle(entries)
+    return lines(map(str, entries))
+
+
+@generator(2020, 2)
+def password_policies(n: int, rng: random.Random) -> str:
+    """``n`` policies and passwords."""
+    rows = []
+    for _ in range(n):
+        char = rng.choice(string.ascii_lowercase[:8])
+        password = "".join(rng.choices(string.ascii_lowercase[:8], k=rng.randint(3, 20)))
+        low = rng.randint(1, len(password) - 1)
+        high = rng.randint(low + 1, len(password))
+        rows.append(f"{low}-{high} {char}: {password}")
+    return lines(rows)
+
+
+@generator(2020, 3)
+def tree_map(n: int, rng: random.Random) -> str:
+    """``n`` rows of a 31 wide slope."""
+    return lines("".join(rng.choices(".#", weights=(3, 1), k=31)) for _ in range(n))
+
+
+@generator(2020, 4)
+def passports(n: int, rng: random.Random) -> str:
+    """``n`` passports, some missing fields and some with invalid values."""
+    records = []
+    for _ in range(n):
+        fields = {
+            "byr": str(rng.randint(1900, 2010)),
+            "iyr": str(rng.randint(2005, 2025)),
+            "eyr": str(rng.randint(2015, 2035)),
+            "hgt": rng.choice((f"{rng.randint(140, 200)}cm", f"{rng.randint(50, 80)}in", str(rng.randint(50, 200)))),
+            "hcl": rng.choice(("#", "")) + "".join(rng.choices("0123456789abcdef", k=6)),
+            "ecl": rng.choice(("amb", "blu", "brn", "gry", "grn", "hzl", "oth", "xry")),
+            "pid": "".join(rng.choices(string.digits, k=rng.choice((9, 9, 9, 10)))),
+            "cid": str(rng.randint(100, 350)),
+        }
+        keys = list(fields)
+        for _ in range(rng.choice((0, 0, 0, 1, 2))):
+            keys.remove(rng.choice(keys))
+        rng.shuffle(keys)
+        tokens = [f"{key}:{fields[key]}" for key in keys]
+        split = rng.randint(1, len(tokens))
+        records.append(" ".join(tokens[:split]) + "\n" + " ".join(tokens[split:]))
+    return "\n\n".join(record.strip() for record in records) + "\n"
+
+
+@generator(2020, 5)
+def boarding_passes(n: int, rng: random.Random) -> str:
+    """``n`` passes for consecutive seats with one missing; past 1023 passes the seats repeat."""
+    start = rng.randint(0, max(1022 - n, 0))
+    missing = rng.randint(1, max(n - 1, 1))
+    seats = [(start + offset) % 1024 for offset in range(n + 1) if offset != missing]
+    rng.shuffle(seats)
+    return lines(
+        f"{seat >> 3:07b}".translate(ROW_LETTERS) + f"{seat & 7:03b}".translate(COLUMN_LETTERS) for seat in seats
+    )
+
+
+@generator(2020, 6)
+def customs_answers(n: int, rng: random.Random) -> str:
+    """``n`` groups of one to five people."""
+    groups = []
+    for _ in range(n):
+        people = ("".join(rng.sample(string.ascii_lowercase, rng.randint(1, 26))) for _ in range(rng.randint(1, 5)))
+        groups.append("\n".join(people))
+    return "\n\n".join(groups) + "\n"
+
+
+@generator(2020, 7)
+def bag_rules(n: int, rng: random.Random) -> str:
+    """``n`` bag rules forming a tree about ``2 * sqrt(n)`` levels deep, with shiny gold halfway down.
+
+    Each bag is held by a single bag among the ``sqrt(n)`` defined just before
+    it, so depth grows with the input rather than staying logarithmic.
+    """
+    n = max(n, 2)
+    # A numeric suffix keeps names unique without ever spelling "bag" or "contain".
+    names = [
+        f"{ADJECTIVES[index % len(ADJECTIVES)]}{index // len(ADJECTIVES) or ''} {rng.choice(COLORS)}"
+        for index in range(n)
+    ]
+    names[n // 2] = "shiny gold"
+    window = math.isqrt(n) + 1
+    children: List[List[int]] = [[] for _ in range(n)]
+    for index in range(1, n):
+        children[rng.randint(max(index - window, 0), index - 1)].append(index)
+
+    rules = []
+    for index, name in enumerate(names):
+        if children[index]:
+            contents = ", ".join(
+                f"{count} {names[child]} {'bag' if count == 1 else 'bags'}"
+                for child, count in ((child, rng.randint(1, 5)) for child in children[index])
+            )
+            rules.append(f"{name} bags contain {contents}.")
+        else:
+            rules.append(f"{name} bags contain no other bags.")
+    rng.shuffle(rules)
+    return lines(rules)
+
+
+@generator(2020, 8)
+def boot_code(n: int, rng: random.Random) -> str:
+    """A tape of ``n`` instructions that loops until one ``jmp`` near the end becomes a ``nop``.
+
+    Forward jumps before the looping ``jmp`` never skip over it, so every run
+    of the original tape reaches it and loops.
+    """
+    n = max(n, 2)
+    looping = rng.randint(n // 2, n - 1)
+    tape = []
+    for index in range(n):
+        if index == looping:
+            tape.append(f"jmp -{rng.randint(1, index)}")
+            continue
+        operation = rng.choices(("acc", "nop", "jmp"), weights=(5, 2, 1))[0]
+        if operation == "jmp":
+            limit = (looping if index < looping else n) - index
+            tape.append(f"jmp +{rng.randint(1, min(limit, 5))}")
+        else:
+            tape.append(f"{operation} {rng.randint(-50, 50):+d}")
+    return lines(tape)
+
+
+@generator(2021, 1)
+def sonar_depths(n: int, rng: random.Random) -> str:
+    """``n`` depths on a random walk."""
+    depth = rng.randint(100, 200)
+    depths = []
+    for _ in range(n):
+        depth = max(depth + rng.randint(-10, 20), 0)
+        depths.append(str(depth))
+    return lines(depths)
+
+
+@generator(2021, 2)
+def submarine_commands(n: int, rng: random.Random) -> str:
+    """``n`` commands."""
+    return lines(f"{rng.choice(('forward', 'down', 'up'))} {rng.randint(1, 9)}" for _ in range(n))
+
+
+@generator(2021, 3)
+def diagnostic_report(n: int, rng: random.Random) -> str:
+    """``n`` distinct binary numbers, at least 12 bits wide."""
+    width = max(12, n.bit_length() + 1)
+    return lines(f"{value:0{width}b}" for value in rng.sample(range(1 << width), n))
+
+
+@generator(2021, 4)
+def bingo(n: int, rng: random.Random) -> str:
+    """A draw order and ``n`` boards; every board wins eventually."""
+    draws = list(range(100))
+    rng.shuffle(draws)
+    boards = []
+    for _ in range(n):
+        numbers = rng.sample(range(100), 25)
+        boards.append("\n".join(" ".join(f"{value:2d}" for value in numbers[row : row + 5]) for row in range(0, 25, 5)))
+    return ",".join(map(str, draws)) + "\n\n" + "\n\n".join(boards) + "\n"
+
+
+@generator(2021, 5)
+def vent_lines(n: int, rng: random.Random) -> str:
+    """``n`` horizontal, vertical or diagonal vent lines on a 1000 x 1000 floor."""
+    rows = []
+    for _ in range(n):
+        x1, y1 = rng.randrange(1000), rng.randrange(1000)
+        kind = rng.randrange(3)
+        if kind == 0:
+            x2, y2 = x1, rng.randrange(1000)
+        elif kind == 1:
+            x2, y2 = rng.randrange(1000), y1
+        else:
+            step_x, step_y = rng.choice((-1, 1)), rng.choice((-1, 1))
+            length = rng.randint(0, min(999 - x1 if step_x > 0 else x1, 999 - y1 if step_y > 0 else y1))
+            x2, y2 = x1 + step_x * length, y1 + step_y * length
+        rows.append(f"{x1},{y1} -> {x2},{y2}")
+    return lines(rows)
+
+
+@generator(2021, 6)
+def lanternfish(n: int, rng: random.Random) -> str:
+    """``n`` fish timers."""
+    return ",".join(rng.choices("12345", k=n)) + "\n"
+
+
+@generator(2021, 7)
+def crab_positions(n: int, rng: random.Random) -> str:
+    """``n`` crab positions."""
+    return ",".join(str(rng.randint(0, 1999)) for _ in range(n)) + "\n"
+
+
+@generator(2021, 8)
+def seven_segment_notes(n: int, rng: random.Random) -> str:
+    """``n`` displays, each with its own scrambled wiring."""
+    rows = []
+    for _ in range(n):
+        wiring = dict(zip("abcdefg", rng.sample("abcdefg", 7)))
+        patterns = ["".join(rng.sample([wiring[segment] for segment in digit], len(digit))) for digit in SEGMENTS]
+        signals = rng.sample(patterns, 10)
+        output = ["".join(rng.sample(patterns[digit], len(patterns[digit]))) for digit in rng.choices(range(10), k=4)]
+        rows.append(" ".join(signals) + " | " + " ".join(output))
+    return lines(rows)
+
+
+@generator(2021, 9, base_size=25)
+def height_map(n: int, rng: random.Random) -> str:
+    """An ``n`` x ``n`` height map."""
+    return digit_grid(n, rng, string.digits)
+
+
+@generator(2021, 10)
+def navigation_subsystem(n: int, rng: random.Random) -> str:
+    """``n`` lines of chunks, about half corrupted and the rest incomplete."""
+    rows = []
+    for index in range(n):
+        corrupted = index % 2 == 1 and rng.random() < 0.9
+        length = rng.randint(20, 110)
+        stack: List[str] = []
+        chars = []
+        while len(chars) < length or not stack:
+            if stack and rng.random() < 0.45:
+                chars.append(BRACKETS[stack.pop()])
+            else:
+                stack.append(rng.choice("([{<"))
+                chars.append(stack[-1])
+        closing = [position for position, char in enumerate(chars) if char not in BRACKETS]
+        if corrupted and closing:
+            position = rng.choice(closing)
+            chars[position] = rng.choice([close for close in BRACKETS.values() if close != chars[position]])
+        rows.append("".join(chars))
+    return lines(rows)
+
+
+@generator(2021, 11, base_size=10)
+def octopus_energy(n: int, rng: random.Random) -> str:
+    """An ``n`` x ``n`` energy grid that synchronises within a few dozen steps.
+
+    Random grids much bigger than the puzzle's 10 x 10 may never flash all at
+    once, so nine cells in ten share one level and the rest are noise.
+    """
+    level = rng.choice(string.digits)
+    return lines(
+        "".join(level if rng.random() < 0.9 else rng.choice(string.digits) for _ in range(n)) for _ in range(n)
+    )
+
+
+@generator(2021, 12, base_size=6)
+def cave_system(n: int, rng: random.Random) -> str:
+    """A connected system of ``n`` caves with no two big caves adjacent.
+
+    Path counts grow exponentially with ``n``, so keep it small.
+    """
+    n = max(n, 3)
+    bigs = max((n - 2) // 4, 1)
+    names = ["start", "end"]
+    names += [word(index, string.ascii_uppercase) * 2 for index in range(bigs)]
+    names += [word(index) * 2 for index in range(n - 2 - bigs)]
+    is_big = [name.isupper() for name in names]
+
+    edges = set()
+    order = list(range(n))
+    rng.shuffle(order)
+    # A spanning chain keeps every cave reachable; a small cave goes between any two big ones.
+    smalls = [index for index in order if not is_big[index] and index > 1]
+    for first, second in zip(order, order[1:]):
+        if is_big[first] and is_big[second]:
+            edges.add((first, rng.choice(smalls)))
+            edges.add((rng.choice(smalls), second))
+        else:
+            edges.add((first, second))
+    for _ in range(n // 2):
+        first, second = rng.sample(range(n), 2)
+        if not (is_big[first] and is_big[second]):
+            edges.add((first, second))
+    return lines(f"{names[first]}-{names[second]}" for first, second in sorted(edges))
+
+
+@generator(2021, 13)
+def transparent_paper(n: int, rng: random.Random) -> str:
+    """``n`` dots on paper folded until it is about ``4 * n`` cells, down to a 40 x 6 code."""
+    width, height = 40, 6
+    code = [[col for col in range(width) if rng.random() < 0.4] or [0] for _ in range(height)]
+    folds = []
+    while width * height < 4 * n or len(folds) < 4:
+        if len(folds) % 2 == 0:
+            folds.append(("x", width))
+            width = 2 * width + 1
+        else:
+            folds.append(("y", height))
+            height = 2 * height + 1
+    folds.reverse()
+
+    dots = []
+    for index in range(max(n, 6)):
+        row = index if index < 6 else rng.randrange(6)
+        x, y = rng.choice(code[row]), row
+        for axis, position in reversed(folds):
+            if rng.random() < 0.5:
+                if axis == "x":
+                    x = 2 * position - x
+                else:
+                    y = 2 * position - y
+        dots.append(f"{x},{y}")
+    return lines(dots) + "\n" + lines(f"fold along {axis}={position}" for axis, position in folds)
+
+
+@generator(2021, 14)
+def polymer_template(n: int, rng: random.Random) -> str:
+    """A template of ``n`` elements and a rule for every pair of the 10 elements."""
+    elements = "BCFHKNOPSV"
+    template = "".join(rng.choices(elements, k=max(n, 2)))
+    rules = (f"{first}{second} -> {rng.choice(elements)}" for first in elements for second in elements)
+    return template + "\n\n" + lines(rules)
+
+
+@generator(2021, 15, base_size=10)
+def risk_grid(n: int, rng: random.Random) -> str:
+    """An ``n`` x ``n`` risk grid."""
+    return digit_grid(n, rng, "123456789")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m aoc.gen", description="Generate synthetic puzzle inputs")
+    parser.add_argument("year", type=int)
+    parser.add_argument("day", type=int)
+    parser.add_argument("size", type=int, help="what the size counts depends on the day")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", help="write to this file instead of stdout")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    try:
+        data = generate(args.year, args.day, args.size, args.seed)
+    except ValueError as error:
+        raise SystemExit(error)
+    if args.output:
+        with open(args.output, "wb") as file_:
+            file_.write(data)
+    else:
+        sys.stdout.buffer.write(data)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""Profile a day's parse, part one and part two separately with cProfile.
+
+``python -m aoc.profile 2021 15`` writes two files for each day:
+
+* ``2021-15.txt``: the stats of each phase, sorted (cumulative time by default).
+* ``2021-15.collapsed``: one ``phase;frame;frame... microseconds`` line per
+  call stack, the input format of flamegraph.pl, speedscope and inferno.
+
+cProfile only records caller/callee pairs, not whole stacks, so the stacks
+are rebuilt from those pairs, splitting a function's time between its callers
+in proportion to the time each caller spent in it.
+"""
+import argparse
+import cProfile
+import contextlib
+import io
+import os
+import pstats
+import sys
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Tuple
+
+from aoc import days, utils
+from aoc.runner import PHASES
+
+OUTPUT_PATH = utils.CACHE_PATH / "profile"
+
+Func = Tuple[str, int, str]
+
+MIN_SECONDS = 1e-6
+
+
+def profile_phases(
+    year: int, day: int, parts: Iterable[int] = (1, 2), filepath: Any = None
+) -> Dict[str, cProfile.Profile]:
+    """One profiler per phase; the input is read into memory first so parse profiles parsing only."""
+    solution = days.load(year, day)
+    filepath = solution.filepath if filepath is None else filepath
+    parse_cache = utils.PARSE_CACHE
+    utils.PARSE_CACHE = False
+    profiles = {}
+    try:
+        with utils.held_input(filepath), contextlib.redirect_stdout(sys.stderr):
+            profiles["parse"] = cProfile.Profile()
+            model = profiles["parse"].runcall(solution.parse, filepath)
+            for part in parts:
+                profiles[PHASES[part]] = cProfile.Profile()
+                profiles[PHASES[part]].runcall(solution.part(part), model)
+    finally:
+        utils.PARSE_CACHE = parse_cache
+    return profiles
+
+
+def frame_label(func: Func) -> str:
+    filename, lineno, name = func
+    if filename == "~":
+        label = name
+    else:
+        if filename.startswith(str(utils.CURRENT_PATH)):
+            filename = os.path.relpath(filename, utils.CURRENT_PATH)
+        label = f"{filename}:{lineno}({name})"
+    return label.replace(";", ",")
+
+
+def collapse(profile: cProfile.Profile, root: str) -> Dict[str, int]:
+    """Collapsed stacks of ``profile`` under a ``root`` frame, in microseconds of own time."""
+    stats = pstats.Stats(profile).stats
+    callees: Dict[Func, List[Tuple[Func, float]]] = defaultdict(list)
+    for func, (_, _, _, _, callers) in stats.items():
+        for caller, (_, _, _, cumulative) in callers.items():
+            callees[caller].append((func, cumulative))
+
+    stacks: Dict[str, int] = defaultdict(int)
+
+    def walk(func: Func, path: List[Func], labels: List[str], share: float) -> None:
+        _, _, own, cumulative, _ = stats[func]
+        labels = labels + [frame_label(func)]
+        stacks[";".join(labels)] += round(own * share * 1e6)
+        for callee, edge_cumulative in callees[func]:
+            callee_share = share * edge_cumulative / stats[callee][3] if stats[callee][3] else 0
+            if callee_share * stats[callee][3] < MIN_SECONDS:
+                continue
+            if callee in path:
+                # Recursion: charge the call to this stack instead of unrolling it again.
+                stacks[";".join(labels + [frame_label(callee)])] += round(stats[callee][2] * callee_share * 1e6)
+                continue
+            walk(callee, path + [callee], labels, callee_share)
+
+    for func, (_, _, _, _, callers) in stats.items():
+        # The profiler's own disable() call is a root too; it is not part of the phase.
+        if not callers and "_lsprof.Profiler" not in func[2]:
+            walk(func, [func], [root], 1.0)
+    return {stack: micros for stack, micros in stacks.items() if micros > 0}
+
+
+def format_stats(profiles: Dict[str, cProfile.Profile], sort: str = "cumulative", limit: int = 30) -> str:
+    stream = io.StringIO()
+    for phase, profile in profiles.items():
+        stream.write(f"===== {phase} =====\n")
+        pstats.Stats(profile, stream=stream).strip_dirs().sort_stats(sort).print_stats(limit)
+    return stream.getvalue()
+
+
+def write_profiles(
+    year: int, day: int, profiles: Dict[str, cProfile.Profile], output_path=OUTPUT_PATH, **options: Any
+) -> List[str]:
+    """Write the stats summary and collapsed stacks of a day; ``options`` go to ``format_stats``."""
+    os.makedirs(output_path, exist_ok=True)
+    stem = os.path.join(output_path, f"{year}-{day:02d}")
+    with open(f"{stem}.txt", "w") as file_:
+        file_.write(format_stats(profiles, **options))
+    with open(f"{stem}.collapsed", "w") as file_:
+        for phase, profile in profiles.items():
+            for stack, micros in sorted(collapse(profile, phase).items()):
+                file_.write(f"{stack} {micros}\n")
+    return [f"{stem}.txt", f"{stem}.collapsed"]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m aoc.profile", description="Profile day solutions with cProfile")
+    parser.add_argument("year", help="a year, or all for every year")
+    parser.add_argument("days", nargs="?", default="all", help="e.g. 1-15, 3,5,7-9 or all (default)")
+    parser.add_argument("--part", type=int, choices=(1, 2), help="only profile this part")
+    parser.add_argument("--input", help="input path, '-' for stdin or fd:N (single day only)")
+    parser.add_argument("--sort", default="cumulative", help="pstats sort key (default cumulative)")
+    parser.add_argument("--limit", type=int, default=30, help="functions listed per phase (default 30)")
+    parser.add_argument("-o", "--output-dir", default=OUTPUT_PATH, help=f"default {OUTPUT_PATH}")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    try:
+        selected = days.select(args.year, args.days)
+    except ValueError as error:
+        raise SystemExit(error)
+
+    filepath = None
+    if args.input is not None:
+        if len(selected) != 1:
+            raise SystemExit("--input needs a single day")
+        filepath = utils.input_arg(args.input)
+
+    parts = (args.part,) if args.part else (1, 2)
+    for year, day in selected:
+        profiles = profile_phases(year, day, parts, filepath)
+        for path in write_profiles(year, day, profiles, args.output_dir, sort=args.sort, limit=args.limit):
+            print(path)
+
+
+if __name__ == "__main__":
+    main()
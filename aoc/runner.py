@@ -0,0 +1,337 @@
+import contextlib
+import json
+import os
+import resource
+import sys
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from aoc import answers, days, utils
+
+PHASES = ("parse", "part_one", "part_two")
+
+TIMINGS_PATH = utils.CACHE_PATH / "timings.json"
+
+Job = Tuple[int, int, int]
+
+SIZE_UNITS = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+
+SNAPSHOT_INTERVAL = 0.005
+SNAPSHOT_FRAMES = 8
+SNAPSHOT_GROWTH = 2.0
+SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, threading.__file__),
+    tracemalloc.Filter(False, "*/_weakrefset.py"),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+class MemoryBudgetExceeded(Exception):
+    """A phase's traced peak memory went over the budget."""
+
+
+@dataclass
+class Measurement:
+    year: int
+    day: int
+    phase: str
+    answer: Any
+    wall_seconds: float
+    cpu_seconds: float
+    peak_memory_bytes: Optional[int]
+    top_allocations: Optional[List[Dict[str, Any]]] = None
+    cached: bool = False
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def cpu_time() -> float:
+    """CPU time of this process and of its children that have exited, such as the workers of a closed pool."""
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return time.process_time() + children.ru_utime + children.ru_stime
+
+
+def measure(func: Callable, *args: Any, trace_memory: bool = True) -> Tuple[Any, float, float, Optional[int]]:
+    """Call ``func`` and return its result with wall time, CPU time and peak traced memory.
+
+    tracemalloc slows allocation-heavy code several times over, so the times
+    come from an untraced call and the peak from a second, traced one. CPU
+    time includes the processes of any pool ``func`` runs and shuts down.
+    Anything the solver prints goes to stderr so it cannot corrupt the report.
+    """
+    with contextlib.redirect_stdout(sys.stderr):
+        wall_start = time.perf_counter()
+        cpu_start = cpu_time()
+        result = func(*args)
+        cpu_seconds = cpu_time() - cpu_start
+        wall_seconds = time.perf_counter() - wall_start
+    peak = peak_memory(func, *args) if trace_memory else None
+    return result, wall_seconds, cpu_seconds, peak
+
+
+def peak_memory(func: Callable, *args: Any) -> int:
+    """Peak traced memory of a call to ``func``, whose output goes to stderr."""
+    tracemalloc.start()
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            result = func(*args)
+        del result
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def parse_size(value: str) -> int:
+    """Parse a byte count such as ``1500000``, ``512K``, ``200M`` or ``2G``."""
+    value = value.strip().upper().removesuffix("B")
+    if value[-1:] in SIZE_UNITS:
+        return int(float(value[:-1]) * SIZE_UNITS[value[-1]])
+    return int(value)
+
+
+def frame_site(traceback: tracemalloc.Traceback) -> str:
+    """The innermost line of solver code in ``traceback``, so ``deepcopy`` and friends are charged to their caller."""
+    frame = traceback[-1]
+    for candidate in reversed(traceback):
+        if candidate.filename.startswith(str(utils.CURRENT_PATH)) and candidate.filename != __file__:
+            frame = candidate
+            break
+    filename = frame.filename
+    if filename.startswith(str(utils.CURRENT_PATH)):
+        filename = os.path.relpath(filename, utils.CURRENT_PATH)
+    return f"{filename}:{frame.lineno}"
+
+
+def allocation_sites(func: Callable, *args: Any, limit: int = 5) -> List[Dict[str, Any]]:
+    """The ``limit`` source lines holding the most traced memory when ``func`` was closest to its peak.
+
+    A background thread takes a snapshot every time traced memory grows
+    ``SNAPSHOT_GROWTH`` times past the previous one, so intermediate
+    structures show up even when ``func`` frees them before returning.
+    Snapshots allocate memory of their own, so the peak reported by
+    ``measure`` must come from a separate run.
+    """
+    largest = {"size": 0, "sites": []}
+    done = threading.Event()
+
+    def snapshot() -> None:
+        size = tracemalloc.get_traced_memory()[0]
+        if size > largest["size"] * SNAPSHOT_GROWTH:
+            sites = defaultdict(lambda: [0, 0])
+            for stat in tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS).statistics("traceback"):
+                site = sites[frame_site(stat.traceback)]
+                site[0] += stat.size
+                site[1] += stat.count
+            largest["size"] = size
+            largest["sites"] = [
+                {"site": site, "size_bytes": size_bytes, "count": count}
+                for site, (size_bytes, count) in sorted(sites.items(), key=lambda item: -item[1][0])[:limit]
+            ]
+
+    def sample() -> None:
+        while not done.wait(SNAPSHOT_INTERVAL):
+            snapshot()
+
+    tracemalloc.start(SNAPSHOT_FRAMES)
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            result = func(*args)
+        snapshot()
+        del result
+    finally:
+        done.set()
+        sampler.join()
+        tracemalloc.stop()
+    return largest["sites"]
+
+
+def check_budget(measurement: Measurement, budget: Optional[int]) -> None:
+    peak = measurement.peak_memory_bytes
+    if budget is not None and peak is not None and peak > budget:
+        raise MemoryBudgetExceeded(
+            f"{measurement.year}/{measurement.day:02d} {measurement.phase} peaked at {peak} bytes, "
+            f"over the {budget} byte budget"
+        )
+
+
+def enforce_budget(measurements: Iterable[Measurement], budget: Optional[int]) -> Iterator[Measurement]:
+    """Pass measurements through, raising ``MemoryBudgetExceeded`` right after the first one over ``budget``."""
+    for measurement in measurements:
+        yield measurement
+        check_budget(measurement, budget)
+
+
+def cached_measurement(year: int, day: int, phase: str, key: str, trace_memory: bool) -> Optional[Measurement]:
+    entry = answers.load(key)
+    if entry is None or (trace_memory and entry["peak_memory_bytes"] is None):
+        return None
+    if not trace_memory:
+        entry["peak_memory_bytes"] = None
+    return Measurement(year, day, phase, cached=True, **entry)
+
+
+def remember(key: Optional[str], measurement: Measurement) -> None:
+    if key is not None:
+        answers.store(
+            key,
+            {
+                "answer": measurement.answer,
+                "wall_seconds": measurement.wall_seconds,
+                "cpu_seconds": measurement.cpu_seconds,
+                "peak_memory_bytes": measurement.peak_memory_bytes,
+            },
+        )
+
+
+def run_day(
+    year: int,
+    day: int,
+    parts: Iterable[int] = (1, 2),
+    filepath: Any = None,
+    trace_memory: bool = True,
+    top_allocations: int = 0,
+    cache: bool = True,
+) -> Iterator[Measurement]:
+    """Read and parse a day's input once, then solve each requested part from the parsed model.
+
+    The raw input is held in memory for the whole run, so days whose parts
+    read the input themselves do not go back to the disk. The parse phase
+    is timed including that read; its traced peak covers parsing alone.
+    With ``trace_memory`` each phase runs twice, timed untraced and then
+    traced for its peak, and with ``top_allocations`` once more to find its
+    largest allocation sites. The parse phase always runs the parser,
+    bypassing ``utils.cache_parse``, so it never times a pickle load instead.
+
+    With ``cache`` parts already solved for the same code and input come
+    from the answer cache, with the timings of the run that solved them;
+    the input is not even parsed when every part is cached.
+    """
+    solution = days.load(year, day)
+    filepath = solution.filepath if filepath is None else filepath
+
+    phases = ["parse"] + [PHASES[part] for part in parts]
+    keys: Dict[str, Optional[str]] = dict.fromkeys(phases)
+    hits: Dict[str, Optional[Measurement]] = dict.fromkeys(phases)
+    if cache and not top_allocations:
+        code_digest = utils.source_digest(solution.part_one)
+        input_digest = utils.file_digest(filepath)
+        for phase in phases:
+            keys[phase] = answers.answer_key(year, day, phase, code_digest, input_digest)
+            hits[phase] = cached_measurement(year, day, phase, keys[phase], trace_memory)
+        if all(hits.values()):
+            yield from hits.values()
+            return
+
+    def parse(filepath: Any) -> Any:
+        parse_cache = utils.PARSE_CACHE
+        utils.PARSE_CACHE = False
+        try:
+            return solution.parse(filepath)
+        finally:
+            utils.PARSE_CACHE = parse_cache
+
+    held_inputs = contextlib.ExitStack()
+
+    def load_and_parse() -> Any:
+        held_inputs.enter_context(utils.held_input(filepath))
+        return parse(filepath)
+
+    try:
+        model, *timings = measure(load_and_parse, trace_memory=trace_memory)
+        measurement = Measurement(year, day, "parse", None, *timings)
+        if trace_memory and top_allocations:
+            measurement.top_allocations = allocation_sites(parse, filepath, limit=top_allocations)
+        remember(keys["parse"], measurement)
+        yield measurement
+
+        for part in parts:
+            if hits[PHASES[part]] is not None:
+                yield hits[PHASES[part]]
+                continue
+            answer, *timings = measure(solution.part(part), model, trace_memory=trace_memory)
+            measurement = Measurement(year, day, PHASES[part], answer, *timings)
+            if trace_memory and top_allocations:
+                measurement.top_allocations = allocation_sites(solution.part(part), model, limit=top_allocations)
+            remember(keys[PHASES[part]], measurement)
+            yield measurement
+    finally:
+        held_inputs.close()
+        if cache and not top_allocations:
+            answers.evict()
+
+
+def job_key(job: Job) -> str:
+    return "{}/{:02d}/{}".format(*job)
+
+
+def load_timings() -> Dict[str, float]:
+    try:
+        with open(TIMINGS_PATH) as file_:
+            return json.load(file_)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_timings(timings: Dict[str, float]) -> None:
+    TIMINGS_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(TIMINGS_PATH, "w") as file_:
+        json.dump(timings, file_, indent=2, sort_keys=True)
+
+
+def _run_job(
+    job: Job, filepath: Any, data: Optional[bytes], trace_memory: bool, top_allocations: int, cache: bool
+) -> List[Measurement]:
+    if data is not None:
+        utils.register_input(filepath, data)
+    # The pool already uses the machine; solvers must not start pools of their own.
+    utils.WORKERS = 1
+    year, day, part = job
+    return list(run_day(year, day, (part,), filepath, trace_memory, top_allocations, cache))
+
+
+def run_parallel(
+    jobs: List[Job],
+    workers: Optional[int] = None,
+    filepath: Any = None,
+    trace_memory: bool = True,
+    top_allocations: int = 0,
+    cache: bool = True,
+) -> Iterator[Measurement]:
+    """Solve ``(year, day, part)`` jobs on a process pool, yielding measurements in job order.
+
+    Jobs are submitted longest first according to the wall times recorded by
+    earlier runs, and jobs never timed before go first of all, so the slowest
+    days start immediately instead of holding up the end of the run. Each
+    job parses its own input; the parse phase is reported once per day.
+    """
+    timings = load_timings()
+    schedule = sorted(jobs, key=lambda job: -timings.get(job_key(job), float("inf")))
+    # Piped inputs only exist in this process, so hand their bytes to the workers.
+    data = None if filepath is None else utils.registered_input(filepath)
+
+    reported_days = set()
+    with ProcessPoolExecutor(workers) as pool:
+        futures = {
+            job: pool.submit(_run_job, job, filepath, data, trace_memory, top_allocations, cache) for job in schedule
+        }
+        try:
+            for job in jobs:
+                parse, solve = futures[job].result()
+                timings[job_key(job)] = parse.wall_seconds + solve.wall_seconds
+                if job[:2] not in reported_days:
+                    reported_days.add(job[:2])
+                    yield parse
+                yield solve
+        finally:
+            save_timings(timings)
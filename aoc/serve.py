@@ -0,0 +1,144 @@
+"""Answer ``(year, day, part, input)`` requests from a long-lived process over a Unix socket.
+
+``python -m aoc serve`` imports every day module once, in the server and in
+each worker of its process pool, so a request costs only the solver. Each
+request is one JSON header line followed by the raw input bytes::
+
+    {"year": 2021, "day": 5, "part": 1, "size": 9194}\\n<9194 bytes of input>
+
+and gets one JSON line back, either the measurement of the part
+(``answer``, ``wall_seconds``, ``parse_seconds``, ``cached``...) or an
+``error``. A connection may carry any number of requests; ``python -m aoc
+ask`` and ``Client`` speak the protocol.
+"""
+import hashlib
+import json
+import os
+import signal
+import socket
+import socketserver
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Optional
+
+from aoc import days, runner, utils
+
+SOCKET_PATH = utils.CACHE_PATH / "aoc.sock"
+
+
+def preload() -> None:
+    # Solvers run on the server's pool, so they must not start pools of their own.
+    utils.WORKERS = 1
+    for year, day in days.select("all"):
+        days.load(year, day)
+
+
+def solve(year: int, day: int, part: int, data: bytes, cache: bool = True) -> Dict[str, Any]:
+    """Solve one part of a day for ``data``, as a JSON-ready dict."""
+    filepath = f"serve/{hashlib.sha256(data).hexdigest()}"
+    utils.register_input(filepath, data)
+    try:
+        parse, measurement = runner.run_day(year, day, (part,), filepath, trace_memory=False, cache=cache)
+    finally:
+        utils.unregister_input(filepath)
+    return {
+        **measurement.to_dict(),
+        "part": part,
+        "parse_seconds": parse.wall_seconds,
+        "parse_cached": parse.cached,
+    }
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    server: "SolverServer"
+
+    def handle(self) -> None:
+        while True:
+            header = self.rfile.readline()
+            if not header.strip():
+                return
+            try:
+                request = json.loads(header)
+                year, day, part, size = (int(request[key]) for key in ("year", "day", "part", "size"))
+                data = self.rfile.read(size)
+                if len(data) != size:
+                    return
+                response = self.server.answer(year, day, part, data)
+            except (ValueError, KeyError, TypeError) as error:
+                # The rest of the stream cannot be framed any more, so answer and hang up.
+                self.respond({"error": f"bad request: {error}"})
+                return
+            self.respond(response)
+
+    def respond(self, response: Dict[str, Any]) -> None:
+        self.wfile.write(json.dumps(response, default=str).encode() + b"\n")
+        self.wfile.flush()
+
+
+class SolverServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Accepts connections on a thread each and solves their requests on a shared process pool."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: Any = SOCKET_PATH, workers: Optional[int] = None, cache: bool = True) -> None:
+        self.socket_path = str(socket_path)
+        self.cache = cache
+        self.available = set(days.select("all"))
+        preload()
+        self.pool = ProcessPoolExecutor(workers, initializer=preload)
+
+        os.makedirs(os.path.dirname(self.socket_path) or ".", exist_ok=True)
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+        super().__init__(self.socket_path, RequestHandler)
+
+    def answer(self, year: int, day: int, part: int, data: bytes) -> Dict[str, Any]:
+        if (year, day) not in self.available or part not in (1, 2):
+            return {"error": f"no solution for {year}/{day:02d} part {part}"}
+        try:
+            return self.pool.submit(solve, year, day, part, data, self.cache).result()
+        except Exception as error:
+            return {"error": f"{type(error).__name__}: {error}"}
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.pool.shutdown(cancel_futures=True)
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+
+def serve(socket_path: Any = SOCKET_PATH, workers: Optional[int] = None, cache: bool = True) -> None:
+    """Serve until interrupted or terminated; either way the socket file is removed."""
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    with SolverServer(socket_path, workers, cache) as server:
+        print(f"serving on {server.socket_path}", flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+class Client:
+    """A connection to a running server; requests on it are answered in order."""
+
+    def __init__(self, socket_path: Any = SOCKET_PATH) -> None:
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.connect(str(socket_path))
+        self._reader = self._socket.makefile("rb")
+
+    def solve(self, year: int, day: int, part: int, data: bytes) -> Dict[str, Any]:
+        header = json.dumps({"year": year, "day": day, "part": part, "size": len(data)}).encode()
+        self._socket.sendall(header + b"\n" + data)
+        response = self._reader.readline()
+        if not response:
+            raise ConnectionError("the server closed the connection")
+        return json.loads(response)
+
+    def close(self) -> None:
+        self._reader.close()
+        self._socket.close()
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
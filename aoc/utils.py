@@ -1,22 +1,482 @@
+import bz2
+import functools
+import gzip
+import hashlib
+import inspect
+import io
+import lzma
+import mmap
+import os
 import pathlib
+import pickle
+import sys
+import time
+import types
+from array import array
+from contextlib import contextmanager
 
 CURRENT_PATH = pathlib.Path(__file__).parent.absolute().parent.absolute()
 
+DATA_PATH = pathlib.Path(os.environ.get("AOC_DATA_ROOT", CURRENT_PATH / "data"))
 
-def read_lines(path, strip=False):
-    with open(f"{CURRENT_PATH}/data/{path}", "r") as file_:
-        line = file_.readline()
+STDIN = "-"
+
+WHITESPACE = b" \t\n\r\x0b\x0c"
+
+BLOCK_SIZE = 1 << 16
+
+CACHE_PATH = CURRENT_PATH / ".cache"
+PARSE_CACHE = os.environ.get("AOC_PARSE_CACHE", "0") != "0"
+PARSE_CACHE_PATH = CACHE_PATH / "parse"
+PARSE_CACHE_MAX_BYTES = 256 << 20
+# Processes a solver may use for a single input; 0 means one per CPU. Solvers stay serial by default
+# so that they never start a pool inside a runner or server worker or a benchmark loop.
+WORKERS = int(os.environ.get("AOC_WORKERS", "1"))
+
+DIGIT_TABLE = bytes.maketrans(b"0123456789", bytes(range(10)))
+
+COMPRESSED_OPENERS = {
+    ".gz": gzip.open,
+    ".bz2": bz2.open,
+    ".xz": lzma.open,
+}
+
+
+def set_data_root(path):
+    global DATA_PATH
+    DATA_PATH = pathlib.Path(path)
+
+
+def get_path(path):
+    return os.path.join(DATA_PATH, path)
+
+
+def resolve_path(path):
+    """Find the file backing ``path`` and the opener that decompresses it.
+
+    A missing ``2021/05.txt`` falls back to ``2021/05.txt.gz``, ``.bz2`` or
+    ``.xz`` under the data root. Compressed files are named directly as well.
+    """
+    full_path = get_path(path)
+    opener = COMPRESSED_OPENERS.get(pathlib.Path(full_path).suffix)
+    if opener is None and not os.path.exists(full_path):
+        for suffix, compressed_opener in COMPRESSED_OPENERS.items():
+            if os.path.exists(full_path + suffix):
+                return full_path + suffix, compressed_opener
+    return full_path, opener or open
+
+
+def worker_count(workers=None):
+    """Processes to split one input over: ``workers`` if given, else ``WORKERS``, with 0 meaning one per CPU."""
+    workers = WORKERS if workers is None else workers
+    return workers or os.cpu_count() or 1
+
+
+def is_piped(path):
+    return path == STDIN or isinstance(path, int)
+
+
+_registered_inputs = {}
+_streamed_inputs = set()
+
+
+def register_input(path, data):
+    """Serve ``data`` for ``path`` from memory instead of the data root."""
+    _registered_inputs[path] = data
+
+
+def unregister_input(path):
+    _registered_inputs.pop(path, None)
 
-        while line:
-            if strip:
-                yield line.strip()
-            else:
-                yield line
-            line = file_.readline()
+
+def clear_inputs():
+    _registered_inputs.clear()
+
+
+def registered_input(path):
+    """The in-memory bytes for ``path``, or ``None`` if it is read from disk.
+
+    Stdin (``-``) and open file descriptors (``int``) can only be consumed
+    once, so callers that need the whole input (mapping, hashing, reading it
+    more than once) get it read to the end and registered, and every later
+    read is served from memory.
+    """
+    if path not in _registered_inputs and is_piped(path):
+        with _open_pipe(path, binary=True) as file_:
+            register_input(path, file_.read())
+    return _registered_inputs.get(path)
+
+
+@contextmanager
+def held_input(path):
+    """Keep the input for ``path`` in memory for the duration of the block and yield its bytes.
+
+    Inputs that are not registered yet are read and registered on entry and
+    unregistered on exit; inputs registered by the caller are left alone.
+    """
+    owns_registration = registered_input(path) is None
+    if owns_registration:
+        register_input(path, read_bytes(path))
+    try:
+        yield registered_input(path)
+    finally:
+        if owns_registration:
+            unregister_input(path)
+
+
+def _open_pipe(path, binary):
+    if path in _streamed_inputs:
+        raise ValueError(f"input {path!r} was already streamed by a single-pass reader and cannot be read again")
+    _streamed_inputs.add(path)
+    return open(sys.stdin.fileno() if path == STDIN else path, "rb" if binary else "rt", closefd=False)
+
+
+def input_arg(value):
+    """Turn a command-line input (a data path, ``-`` for stdin or ``fd:N``) into an input path."""
+    return int(value[3:]) if value.startswith("fd:") else value
+
+
+def input_path(default):
+    """The input named on the command line, or ``default`` if there is none."""
+    return input_arg(sys.argv[1]) if len(sys.argv) > 1 else default
+
+
+def open_input(path, binary=False):
+    """Open an input for reading from memory, the data root or a pipe.
+
+    Piped inputs that nothing has registered yet are streamed straight from
+    the pipe, so single-pass readers never hold them in memory whole.
+    """
+    if path not in _registered_inputs and is_piped(path):
+        return _open_pipe(path, binary)
+    data = registered_input(path)
+    if data is not None:
+        file_ = io.BytesIO(data)
+        return file_ if binary else io.TextIOWrapper(file_)
+    full_path, opener = resolve_path(path)
+    return opener(full_path, "rb" if binary else "rt")
+
+
+def read_lines(path, strip=False, block_size=BLOCK_SIZE, binary=False):
+    """Yield the lines of a data file, reading it in ``block_size`` chunks.
+
+    Lines keep their newline unless ``strip`` is set, and are then produced
+    by ``readlines`` a chunk at a time. Stripped lines come from splitting
+    each chunk on the newline, which already removes it, so stripping only
+    allocates a new line when it has other surrounding whitespace.
+    ``binary`` yields ``bytes`` instead of ``str``.
+    """
+    newline = b"\n" if binary else "\n"
+    with open_input(path, binary) as file_:
+        if not strip:
+            lines = file_.readlines(block_size)
+            while lines:
+                yield from lines
+                lines = file_.readlines(block_size)
+            return
+
+        remainder = newline[:0]
+        block = file_.read(block_size)
+        while block:
+            lines = (remainder + block).split(newline)
+            remainder = lines.pop()
+            yield from map(type(block).strip, lines)
+            block = file_.read(block_size)
+
+        if remainder:
+            yield remainder.strip()
 
 
 def read_file(path):
     data = ""
-    with open(f"{CURRENT_PATH}/data/{path}", "r") as file_:
+    with open_input(path) as file_:
         data = file_.read()
     return data
+
+
+def read_records(path, separator=None, offsets=False):
+    """Yield the blank-line separated records of a data file.
+
+    Each record is its list of stripped lines, or the lines joined with
+    ``separator`` when one is given. With ``offsets`` each record is the
+    ``(start, end)`` byte range it spans instead, so very large files can be
+    sharded without holding any record text. Runs of blank lines never produce
+    empty records.
+    """
+    if offsets:
+        yield from _read_record_offsets(path)
+        return
+
+    record = []
+    for line in read_lines(path, strip=True):
+        if line:
+            record.append(line)
+        elif record:
+            yield record if separator is None else separator.join(record)
+            record = []
+    if record:
+        yield record if separator is None else separator.join(record)
+
+
+def _read_record_offsets(path):
+    position = 0
+    start = None
+    end = 0
+    for line in read_lines(path, binary=True):
+        if line.strip():
+            if start is None:
+                start = position
+            end = position + len(line)
+        elif start is not None:
+            yield start, end
+            start = None
+        position += len(line)
+    if start is not None:
+        yield start, end
+
+
+def read_bytes(path):
+    with open_input(path, binary=True) as file_:
+        return file_.read()
+
+
+def read_ints(path, separator=None, typecode="q"):
+    """Parse integers separated by whitespace (or ``separator``) into an ``array``.
+
+    The file is streamed block by block and ``int`` parses the raw ``bytes``
+    tokens directly, so no ``str`` or list of all values is ever built.
+    """
+    values = array(typecode)
+    with open_input(path, binary=True) as file_:
+        remainder = b""
+        block = file_.read(BLOCK_SIZE)
+        while block:
+            tokens = (remainder + block).split(separator)
+            if separator is None and block[-1:].isspace():
+                remainder = b""
+            else:
+                remainder = tokens.pop() if tokens else b""
+            values.extend(map(int, tokens))
+            block = file_.read(BLOCK_SIZE)
+
+    if remainder.strip():
+        values.append(int(remainder))
+    return values
+
+
+def read_int_csv(path, typecode="q"):
+    return read_ints(path, b",", typecode)
+
+
+def read_digit_grid(path):
+    """Read a grid of digits as a flat ``bytearray`` of cell values, row by row.
+
+    Returns ``(cells, width, height)``; cell ``(row, col)`` is at
+    ``cells[row * width + col]``. Raises ``ValueError`` unless every row
+    has the same length and holds only digits.
+    """
+    data = read_bytes(path)
+    if data.translate(None, b"0123456789\r\n"):
+        raise ValueError(f"{path} has characters other than digits in its grid")
+    rows = data.rstrip(b"\r\n").splitlines()
+    width = len(rows[0]) if rows else 0
+    if width == 0 or any(len(row) != width for row in rows):
+        raise ValueError(f"{path} is not a rectangular digit grid")
+    return bytearray(data.translate(DIGIT_TABLE, b"\r\n")), width, len(rows)
+
+
+@contextmanager
+def map_file(path):
+    """Map a data file read-only into memory.
+
+    The mapping supports ``find``, indexing and slicing without copying the
+    whole file; pair it with ``iter_blocks`` for bulk ``bytes`` operations.
+    Any ``memoryview`` taken from it must be released before the block exits.
+    Compressed inputs cannot be mapped and are decompressed into ``bytes``;
+    in-memory inputs are handed out as they are.
+    """
+    data = registered_input(path)
+    if data is not None:
+        yield data
+        return
+
+    full_path, opener = resolve_path(path)
+    if opener is not open:
+        with opener(full_path, "rb") as file_:
+            yield file_.read()
+        return
+
+    with open(full_path, "rb") as file_:
+        if os.fstat(file_.fileno()).st_size == 0:
+            # Empty files cannot be mapped.
+            yield b""
+            return
+        with mmap.mmap(file_.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield data
+
+
+def iter_blocks(data, block_size=BLOCK_SIZE):
+    """Yield ``data`` as consecutive ``bytes`` blocks of at most ``block_size``."""
+    for start in range(0, len(data), block_size):
+        yield data[start : start + block_size]
+
+
+def line_offsets(data):
+    """Index of line boundaries: line ``i`` spans ``offsets[i]:offsets[i + 1]``."""
+    offsets = array("q", [0])
+    find = data.find
+    position = find(b"\n")
+    while position != -1:
+        offsets.append(position + 1)
+        position = find(b"\n", position + 1)
+    if offsets[-1] != len(data):
+        offsets.append(len(data))
+    return offsets
+
+
+def iter_line_views(data, offsets=None, strip=False):
+    """Yield each line of ``data`` as a ``memoryview`` slice, without decoding or copying."""
+    if offsets is None:
+        offsets = line_offsets(data)
+    view = memoryview(data)
+    try:
+        for idx in range(len(offsets) - 1):
+            start = offsets[idx]
+            stop = offsets[idx + 1]
+            if strip:
+                while start < stop and data[start] in WHITESPACE:
+                    start += 1
+                while stop > start and data[stop - 1] in WHITESPACE:
+                    stop -= 1
+            yield view[start:stop]
+    finally:
+        view.release()
+
+
+def file_digest(path):
+    data = registered_input(path)
+    if data is not None:
+        return hashlib.sha256(data).hexdigest()
+
+    digest = hashlib.sha256()
+    full_path, _ = resolve_path(path)
+    with open(full_path, "rb") as file_:
+        block = file_.read(BLOCK_SIZE)
+        while block:
+            digest.update(block)
+            block = file_.read(BLOCK_SIZE)
+    return digest.hexdigest()
+
+
+def source_digest(func):
+    """Hash of the source of ``func``'s module and of this module, i.e. its code version."""
+    digest = hashlib.sha256()
+    for source_file in (inspect.getsourcefile(func), __file__):
+        with open(source_file, "rb") as file_:
+            digest.update(file_.read())
+    return digest.hexdigest()
+
+
+def evict_lru(directory, max_bytes, pattern="*.pickle"):
+    """Delete the least recently used files of ``directory`` until it fits in ``max_bytes``; return how many went.
+
+    Recency is the modification time, which readers refresh on every hit.
+    """
+    entries = []
+    for path in pathlib.Path(directory).glob(pattern):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    evicted = 0
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total -= size
+        evicted += 1
+    return evicted
+
+
+def cache_parse(parser):
+    """Cache ``parser(path, *args)`` on disk when ``AOC_PARSE_CACHE=1``.
+
+    Entries are keyed by the parser's identity and code version, the content
+    hash of the data file and the extra arguments, so editing either the
+    solver or the input invalidates them. Generators are stored as tuples.
+    The least recently used entries are evicted once the cache grows past
+    ``PARSE_CACHE_MAX_BYTES``.
+    """
+
+    @functools.wraps(parser)
+    def wrapper(path, *args):
+        if not PARSE_CACHE:
+            return parser(path, *args)
+
+        identity = f"{inspect.getsourcefile(parser)}:{parser.__qualname__}:{source_digest(parser)}"
+        key = hashlib.sha256(f"{identity}:{file_digest(path)}:{args!r}".encode()).hexdigest()
+        cache_file = PARSE_CACHE_PATH / f"{key}.pickle"
+        try:
+            with open(cache_file, "rb") as file_:
+                result = pickle.load(file_)
+            os.utime(cache_file)
+            return result
+        except (OSError, EOFError, pickle.UnpicklingError):
+            pass
+
+        result = parser(path, *args)
+        if isinstance(result, types.GeneratorType):
+            result = tuple(result)
+
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        partial_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            with open(partial_file, "wb") as file_:
+                pickle.dump(result, file_, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(partial_file, cache_file)
+        finally:
+            if partial_file.exists():
+                partial_file.unlink()
+        evict_lru(PARSE_CACHE_PATH, PARSE_CACHE_MAX_BYTES)
+        return result
+
+    return wrapper
+
+
+def measure_throughput(path, block_size=BLOCK_SIZE):
+    """Stream ``path`` through its decompressor and time it."""
+    size = 0
+    start = time.perf_counter()
+    with open_input(path, binary=True) as file_:
+        block = file_.read(block_size)
+        while block:
+            size += len(block)
+            block = file_.read(block_size)
+    seconds = time.perf_counter() - start
+    if registered_input(path) is not None:
+        full_path, stored_size = path, size
+    else:
+        full_path, _ = resolve_path(path)
+        stored_size = os.path.getsize(full_path)
+    return {
+        "path": full_path,
+        "stored_bytes": stored_size,
+        "bytes": size,
+        "seconds": seconds,
+        "mb_per_second": size / seconds / 1e6 if seconds else float("inf"),
+    }
+
+
+if __name__ == "__main__":
+    for path in sys.argv[1:]:
+        stats = measure_throughput(path)
+        print(
+            f"{stats['path']}: {stats['stored_bytes']} -> {stats['bytes']} bytes "
+            f"in {stats['seconds']:.3f}s ({stats['mb_per_second']:.1f} MB/s)"
+        )
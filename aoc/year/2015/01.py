@@ -32,39 +32,118 @@ What is the position of the character that causes Santa to first enter the basem
 """
 # https://adventofcode.com/2015/day/1/input
 
+import itertools
+import math
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Optional, Tuple
 
-from aoc import utils
+from aoc import days, utils
 
+# Each instruction as a signed byte: "(" goes up a floor, ")" down one and anything else stays put.
+DELTAS = bytes(1 if char == ord("(") else 255 if char == ord(")") else 0 for char in range(256))
 
-def get_letters(filepath):
-    data = utils.read_file(filepath)
-    for char in data:
-        yield char
+CHUNK_SIZE = 1 << 20
+PARALLEL_MIN_BYTES = 1 << 24
+CHUNKS_PER_WORKER = 4
 
 
-def char_to_int(char):
-    if char == "(":
-        return 1
-    elif char == ")":
-        return -1
+@dataclass(frozen=True)
+class Chunk:
+    start: int
+    stop: int
+    delta: int
+    lowest: int
 
 
-def part_one(filepath):
-    floor = 0
-    for char in get_letters(filepath):
-        floor += char_to_int(char)
-    return floor
+@dataclass(frozen=True)
+class FloorScan:
+    """The instructions in ``filepath`` summarised chunk by chunk.
+
+    ``delta`` is a chunk's net change of floor and ``lowest`` the lowest floor
+    it reaches relative to where it starts, never above 0.
+    """
+
+    filepath: str
+    chunks: Tuple[Chunk, ...]
+
+
+def floors(block: bytes, floor: int):
+    """``floor``, then the floor after each instruction of ``block``."""
+    return itertools.accumulate(memoryview(block.translate(DELTAS)).cast("b"), initial=floor)
+
+
+def summarize(data, start: int = 0, stop: Optional[int] = None) -> Tuple[int, int]:
+    """Net delta and lowest relative floor of ``data[start:stop]``, scanned a block at a time."""
+    stop = len(data) if stop is None else stop
+    delta = lowest = 0
+    for block_start in range(start, stop, utils.BLOCK_SIZE):
+        block = data[block_start : min(block_start + utils.BLOCK_SIZE, stop)]
+        lowest = min(lowest, min(floors(block, delta)))
+        delta += block.count(b"(") - block.count(b")")
+    return delta, lowest
+
+
+def summarize_file(filepath, start: int, stop: int) -> Tuple[int, int]:
+    with utils.map_file(filepath) as data:
+        return summarize(data, start, stop)
 
 
-def part_two(filepath):
+def scan(filepath, workers: Optional[int] = None) -> FloorScan:
+    """Summarise the instructions in chunks, on a process pool once the input is large enough to pay for it.
+
+    The pool has ``utils.worker_count(workers)`` processes, so scanning is
+    serial unless asked otherwise. Workers map data files themselves;
+    in-memory inputs are sent to them a chunk at a time.
+    """
+    workers = utils.worker_count(workers)
+    with utils.map_file(filepath) as data:
+        size = len(data)
+        parallel = workers > 1 and size >= PARALLEL_MIN_BYTES
+        chunk_size = math.ceil(size / (workers * CHUNKS_PER_WORKER)) if parallel else CHUNK_SIZE
+        bounds = [(start, min(start + chunk_size, size)) for start in range(0, size, chunk_size)]
+        if parallel:
+            with ProcessPoolExecutor(workers) as pool:
+                if utils.registered_input(filepath) is None:
+                    futures = [pool.submit(summarize_file, filepath, start, stop) for start, stop in bounds]
+                else:
+                    futures = [pool.submit(summarize, data[start:stop]) for start, stop in bounds]
+                summaries = [future.result() for future in futures]
+        else:
+            summaries = [summarize(data, start, stop) for start, stop in bounds]
+    return FloorScan(filepath, tuple(Chunk(start, stop, *summary) for (start, stop), summary in zip(bounds, summaries)))
+
+
+def basement_position(data, start: int, stop: int, floor: int) -> Optional[int]:
+    """Position of the first instruction in ``data[start:stop]`` that takes Santa from ``floor`` to -1."""
+    for block_start in range(start, stop, utils.BLOCK_SIZE):
+        block = data[block_start : min(block_start + utils.BLOCK_SIZE, stop)]
+        for index, value in enumerate(floors(block, floor)):
+            if value == -1:
+                return block_start + index
+        floor += block.count(b"(") - block.count(b")")
+    return None
+
+
+def part_one(floor_scan: FloorScan) -> int:
+    return sum(chunk.delta for chunk in floor_scan.chunks)
+
+
+def part_two(floor_scan: FloorScan) -> Optional[int]:
+    """Find the first chunk that reaches the basement from the summaries and rescan only that one."""
     floor = 0
-    for idx, char in enumerate(get_letters(filepath)):
-        floor += char_to_int(char)
-        if floor == -1:
-            return idx + 1
+    for chunk in floor_scan.chunks:
+        if floor + chunk.lowest <= -1:
+            with utils.map_file(floor_scan.filepath) as data:
+                return basement_position(data, chunk.start, chunk.stop, floor)
+        floor += chunk.delta
+    return None
+
+
+DAY = days.Day("2015/01.txt", part_one, part_two, parse=scan)
 
 
 if __name__ == "__main__":
-    filepath = "2015/01.txt"
-    print(part_one(filepath))
-    print(part_two(filepath))
+    floor_scan = scan(utils.input_path("2015/01.txt"))
+    print(part_one(floor_scan))
+    print(part_two(floor_scan))
@@ -23,70 +23,100 @@ How many total feet of ribbon should they order?
 """
 # https://adventofcode.com/2015/day/2/input
 
-from dataclasses import dataclass
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
 
-from aoc import utils
+from aoc import days, utils
 
+PARALLEL_MIN_BYTES = 1 << 24
 
-@dataclass
-class Present:
-    length: int
-    width: int
-    height: int
+Columns = Tuple[array, array, array]
 
-    @property
-    def sides(self):
-        return (
-            (self.length, self.width),
-            (self.width, self.height),
-            (self.height, self.length),
-        )
 
-    @property
-    def surface_area(self):
-        return sum([2 * side[0] * side[1] for side in self.sides])
+def columns(data: bytes) -> Columns:
+    """The lengths, widths and heights of the presents listed in ``data``, one ``array`` each."""
+    values = array("l", map(int, data.replace(b"x", b" ").split()))
+    if len(values) % 3:
+        raise ValueError("every present needs three dimensions")
+    return values[0::3], values[1::3], values[2::3]
 
-    @property
-    def smallest_side(self):
-        sides = self.sides
-        smallest_side = sides[0]
-        for side in sides:
-            if side[0] * side[1] < smallest_side[0] * smallest_side[1]:
-                smallest_side = side
-        return smallest_side
 
-    @property
-    def smallest_side_surface_area(self):
-        smallest_side = self.smallest_side
-        return smallest_side[0] * smallest_side[1]
+def parse(filepath) -> Columns:
+    return columns(utils.read_bytes(filepath))
 
-    @property
-    def volume(self):
-        return self.length * self.width * self.height
 
+def wrap(dimensions: Columns) -> Tuple[int, int]:
+    """Paper and ribbon for every present, in one pass over the columns.
 
-def get_presents(filepath):
-    for line in utils.read_lines(filepath):
-        length, width, height = line.split("x")
-        yield Present(length=int(length), width=int(width), height=int(height))
+    The smallest side is the one without the longest edge, so its area is the
+    volume divided by that edge and its perimeter skips it.
+    """
+    paper = ribbon = 0
+    for length, width, height in zip(*dimensions):
+        longest = max(length, width, height)
+        volume = length * width * height
+        paper += 2 * (length * width + width * height + height * length) + (volume // longest if longest else 0)
+        ribbon += 2 * (length + width + height - longest) + volume
+    return paper, ribbon
 
 
-def part_one(filepath):
-    total = 0
-    for present in get_presents(filepath):
-        total += present.surface_area + present.smallest_side_surface_area
-    return total
+def wrap_bytes(data: bytes) -> Tuple[int, int]:
+    return wrap(columns(data))
 
 
-def part_two(filepath):
-    total = 0
-    for present in get_presents(filepath):
-        smallest_side = present.smallest_side
-        total += (smallest_side[0] * 2) + (smallest_side[1] * 2) + present.volume
-    return total
+def wrap_range(filepath, start: int, stop: int) -> Tuple[int, int]:
+    with utils.map_file(filepath) as data:
+        return wrap_bytes(data[start:stop])
+
+
+def shard_bounds(data, shards: int) -> List[Tuple[int, int]]:
+    """Split ``data`` into about ``shards`` byte ranges that end on line ends."""
+    bounds = []
+    start = 0
+    for shard in range(1, shards + 1):
+        stop = len(data) if shard == shards else data.find(b"\n", max(start, len(data) * shard // shards)) + 1
+        stop = stop or len(data)
+        if stop > start:
+            bounds.append((start, stop))
+            start = stop
+    return bounds
+
+
+def wrap_file(filepath, workers: Optional[int] = None) -> Tuple[int, int]:
+    """Paper and ribbon for a whole manifest from a single read.
+
+    Large manifests are sharded across ``utils.worker_count(workers)``
+    processes, each parsing and totalling its own range of lines; workers
+    map data files themselves and are sent in-memory inputs a shard at a time.
+    """
+    workers = utils.worker_count(workers)
+    with utils.map_file(filepath) as data:
+        if workers == 1 or len(data) < PARALLEL_MIN_BYTES:
+            return wrap_bytes(data[:])
+
+        bounds = shard_bounds(data, workers)
+        with ProcessPoolExecutor(workers) as pool:
+            if utils.registered_input(filepath) is None:
+                futures = [pool.submit(wrap_range, filepath, start, stop) for start, stop in bounds]
+            else:
+                futures = [pool.submit(wrap_bytes, data[start:stop]) for start, stop in bounds]
+            totals = [future.result() for future in futures]
+    return sum(paper for paper, _ in totals), sum(ribbon for _, ribbon in totals)
+
+
+def part_one(dimensions: Columns) -> int:
+    return wrap(dimensions)[0]
+
+
+def part_two(dimensions: Columns) -> int:
+    return wrap(dimensions)[1]
+
+
+DAY = days.Day("2015/02.txt", part_one, part_two, parse=parse)
 
 
 if __name__ == "__main__":
-    filepath = "2015/02.txt"
-    print(part_one(filepath))
-    print(part_two(filepath))
+    paper, ribbon = wrap_file(utils.input_path("2015/02.txt"))
+    print(paper)
+    print(ribbon)
@@ -27,64 +27,63 @@ For example:
 """
 # https://adventofcode.com/2015/day/3/input
 
-from dataclasses import dataclass
+import itertools
+
+from aoc import days, utils
+
+# Houses are packed into one int, x * STRIDE + y, so every move is a single addition.
+STRIDE = 1 << 32
+# The visited index is a bitmap stored as TILE-house runs of a column, only for the runs ever reached.
+TILE_BITS = 6
+STEPS = (1, -1, STRIDE, -STRIDE, 0)
+# Each byte as an index into STEPS: ^ v > < move, anything else (the trailing newline) stays put.
+MOVES = bytes({ord("^"): 0, ord("v"): 1, ord(">"): 2, ord("<"): 3}.get(char, 4) for char in range(256))
+
+
+def displacement(moves: bytes) -> int:
+    return moves.count(b"^") - moves.count(b"v") + (moves.count(b">") - moves.count(b"<")) * STRIDE
+
+
+def deliver(filepath, agents: int = 1) -> int:
+    """Number of houses visited at least once by ``agents`` taking turns to follow the moves.
+
+    The moves are read a block at a time and each agent's share of a block,
+    every ``agents``-th byte, is decoded and walked by C code: ``translate``,
+    ``map`` and ``accumulate`` feeding ``set.update``. Only the distinct houses
+    of the block are then set in the bitmap, so memory stays at a few bytes
+    per house however many moves there are.
+    """
+    mask = (1 << TILE_BITS) - 1
+    positions = [0] * agents
+    tiles = {0: 1}
+    offset = 0
+    with utils.map_file(filepath) as data:
+        for block in utils.iter_blocks(data):
+            houses = set()
+            for agent in range(agents):
+                moves = block[(agent - offset) % agents :: agents]
+                steps = map(STEPS.__getitem__, moves.translate(MOVES))
+                houses.update(itertools.accumulate(steps, initial=positions[agent]))
+                positions[agent] += displacement(moves)
+            get = tiles.get
+            for house in houses:
+                tiles[house >> TILE_BITS] = get(house >> TILE_BITS, 0) | 1 << (house & mask)
+            offset += len(block)
+    return sum(tile.bit_count() for tile in tiles.values())
 
-from aoc import utils
 
-
-@dataclass
-class Point:
-    x: int
-    y: int
-
-    @property
-    def key(self):
-        return (self.x, self.y)
-
-
-def get_letters(filepath):
-    data = utils.read_file(filepath)
-    for char in data:
-        yield char
+def part_one(filepath):
+    return deliver(filepath, 1)
 
 
-def update_point(point, char):
-    if char == "<":
-        point.x += -1
-    elif char == ">":
-        point.x += 1
-    elif char == "^":
-        point.y += 1
-    elif char == "v":
-        point.y += -1
+def part_two(filepath):
+    return deliver(filepath, 2)
 
 
-def part_one(filepath):
-    houses = set()
-    point = Point(x=0, y=0)
-    houses.add(point.key)
-    for char in get_letters(filepath):
-        update_point(point, char)
-        houses.add(point.key)
-    return len(houses)
-
-
-def part_two(file_path):
-    houses = set()
-    santa_point = Point(x=0, y=0)
-    robo_point = Point(x=0, y=0)
-    houses.add(santa_point.key)
-    for idx, char in enumerate(get_letters(filepath)):
-        if idx % 2 == 0:
-            update_point(santa_point, char)
-            houses.add(santa_point.key)
-        else:
-            update_point(robo_point, char)
-            houses.add(robo_point.key)
-    return len(houses)
+DAY = days.Day("2015/03.txt", part_one, part_two)
 
 
 if __name__ == "__main__":
-    filepath = "2015/03.txt"
+    filepath = utils.input_path("2015/03.txt")
     print(part_one(filepath))
     print(part_two(filepath))
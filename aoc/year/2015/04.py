@@ -14,22 +14,103 @@ Now find one that starts with six zeroes.
 """
 
 import hashlib
+import itertools
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Optional
 
+from aoc import days, utils
 
-def get_hash_hex(value):
-    return hashlib.md5(value.encode()).hexdigest()
+# Nonces per task handed to a worker, and tasks queued per worker so none idles between them.
+BATCH_SIZE = 1 << 16
+BATCHES_PER_WORKER = 2
 
+# A nonce is fed to MD5 as its leading digits, hashed once per SUFFIX_SPAN nonces, then a pre-rendered suffix.
+SUFFIX_DIGITS = 3
+SUFFIX_SPAN = 10 ** SUFFIX_DIGITS
+SUFFIXES = tuple(b"%0*d" % (SUFFIX_DIGITS, low) for low in range(SUFFIX_SPAN))
+# Nonces below SUFFIX_SPAN have no leading digits and no zero padding.
+SHORT_SUFFIXES = tuple(b"%d" % low for low in range(SUFFIX_SPAN))
 
-def part_one_and_two(value, prefix):
-    num = 1
-    while True:
-        if get_hash_hex(f"{value}{num}")[: len(prefix)] == prefix:
-            return num
-        num += 1
+
+def parse(filepath):
+    return utils.read_file(filepath).strip()
+
+
+def search(key: str, zeroes: int, start: int, stop: int) -> Optional[int]:
+    """The lowest nonce in ``[start, stop)`` whose hash starts with ``zeroes`` zeroes, if any.
+
+    The key is hashed once and each run of ``SUFFIX_SPAN`` nonces extends a
+    copy of that state with their shared leading digits, so a nonce costs one
+    state copy, one short update and one ``digest()``. Zeroes are checked on
+    the raw digest, two per byte, without rendering it in hex.
+    """
+    whole, half = divmod(zeroes, 2)
+    zero_bytes = bytes(whole)
+    keyed = hashlib.md5(key.encode())
+    for high in range(start // SUFFIX_SPAN, (stop - 1) // SUFFIX_SPAN + 1):
+        prefixed = keyed.copy()
+        if high:
+            prefixed.update(b"%d" % high)
+        suffixes = SUFFIXES if high else SHORT_SUFFIXES
+        first = max(start - high * SUFFIX_SPAN, 0)
+        last = min(stop - high * SUFFIX_SPAN, SUFFIX_SPAN)
+        copy = prefixed.copy
+        for low, suffix in enumerate(suffixes[first:last], first):
+            md5 = copy()
+            md5.update(suffix)
+            digest = md5.digest()
+            if digest.startswith(zero_bytes) and (not half or digest[whole] < 16):
+                return high * SUFFIX_SPAN + low
+    return None
+
+
+def mine(key: str, zeroes: int, workers: Optional[int] = None) -> int:
+    """The lowest positive nonce whose hash starts with ``zeroes`` zeroes.
+
+    With more than one worker (``utils.worker_count``, serial by default),
+    batches of nonces are handed out in order to a process pool. A hit only
+    bounds the answer: batches below it that are still running may hold a
+    lower one, so they are waited for, while queued batches above it are
+    cancelled.
+    """
+    workers = utils.worker_count(workers)
+    if workers == 1:
+        for start in itertools.count(1, BATCH_SIZE):
+            nonce = search(key, zeroes, start, start + BATCH_SIZE)
+            if nonce is not None:
+                return nonce
+
+    with ProcessPoolExecutor(workers) as pool:
+        starts = itertools.count(1, BATCH_SIZE)
+        pending = {}
+        best = None
+        while best is None or any(start < best for start in pending.values()):
+            while best is None and len(pending) < workers * BATCHES_PER_WORKER:
+                start = next(starts)
+                pending[pool.submit(search, key, zeroes, start, start + BATCH_SIZE)] = start
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                del pending[future]
+                nonce = future.result()
+                if nonce is not None and (best is None or nonce < best):
+                    best = nonce
+        pool.shutdown(cancel_futures=True)
+    return best
+
+
+def part_one(key: str) -> int:
+    return mine(key, 5)
+
+
+def part_two(key: str) -> int:
+    return mine(key, 6)
+
+
+DAY = days.Day("2015/04.txt", part_one, part_two, parse=parse)
 
 
 if __name__ == "__main__":
-    inp = "iwrupvqb"
+    inp = parse(utils.input_path("2015/04.txt"))
 
-    print(part_one_and_two(inp, "00000"))
-    print(part_one_and_two(inp, "000000"))
+    print(part_one(inp))
+    print(part_two(inp))
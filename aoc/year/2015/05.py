@@ -34,17 +34,21 @@ How many strings are nice under these new rules?
 
 import re
 
-from aoc import utils
+from aoc import days, utils
 
 
-def part_one(filepath):
+def parse(filepath):
+    return tuple(utils.read_lines(filepath, strip=True))
+
+
+def part_one(lines):
     double_letters = re.compile(r"(.)\1{1,}")
     three_vowels = re.compile(r"^(.*[aeiou].*){3,}$")
     does_not_have = re.compile(r"^((?!ab|cd|pq|xy).)*$")
 
     valid_count = 0
 
-    for line in utils.read_lines(filepath, strip=True):
+    for line in lines:
         has_double_letters = double_letters.search(line) is not None
         has_three_vowels = three_vowels.search(line) is not None
         has_does_not_have = does_not_have.search(line) is not None
@@ -54,13 +58,13 @@ def part_one(filepath):
     return valid_count
 
 
-def part_two(filepath):
+def part_two(lines):
     double_pairs = re.compile(r"([a-z][a-z]).*\1")
     skip_letter = re.compile(r"([a-z]).{1}\1")
 
     valid_count = 0
 
-    for line in utils.read_lines(filepath, strip=True):
+    for line in lines:
         has_double_pairs = double_pairs.search(line) is not None
         has_skip_letter = skip_letter.search(line) is not None
         if has_double_pairs and has_skip_letter:
@@ -69,7 +73,10 @@ def part_two(filepath):
     return valid_count
 
 
+DAY = days.Day("2015/05.txt", part_one, part_two, parse=parse)
+
+
 if __name__ == "__main__":
-    filepath = "2015/05.txt"
-    print(part_one(filepath))
-    print(part_two(filepath))
+    lines = parse(utils.input_path("2015/05.txt"))
+    print(part_one(lines))
+    print(part_two(lines))
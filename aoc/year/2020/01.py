@@ -31,7 +31,7 @@ In your expense report, what is the product of the three entries that sum to 202
 """
 # https://adventofcode.com/2020/day/1/input
 
-from aoc import utils
+from aoc import days, utils
 
 
 def get_left_right(left, right, value):
@@ -43,12 +43,11 @@ def get_left_right(left, right, value):
 
 
 def get_numbers(filepath):
-    data = []
-    for line in utils.read_lines(filepath):
-        num = line.strip()
-        if num:
-            data.append(int(num))
-    return data
+    return utils.read_ints(filepath).tolist()
+
+
+def parse(filepath):
+    return sorted(get_numbers(filepath))
 
 
 def get_parts(data, value):
@@ -70,9 +69,7 @@ def get_parts(data, value):
     return None, None
 
 
-def part_one(filepath, value):
-    data = get_numbers(filepath)
-    data.sort()
+def part_one(data, value):
     left, right = get_parts(data, value)
 
     if left and right:
@@ -80,10 +77,7 @@ def part_one(filepath, value):
     return None, None, None
 
 
-def part_two(filepath, value):
-    data = get_numbers(filepath)
-    data.sort()
-
+def part_two(data, value):
     for idx, num in enumerate(data):
         difference = value - num
         sub_data = data[: idx + 1] + data[idx + 1 :]
@@ -93,8 +87,16 @@ def part_two(filepath, value):
     return None, None, None, None
 
 
+DAY = days.Day(
+    "2020/01.txt",
+    lambda data: part_one(data, 2020)[-1],
+    lambda data: part_two(data, 2020)[-1],
+    parse=parse,
+)
+
+
 if __name__ == "__main__":
     value = 2020
-    filepath = "2020/01.txt"
-    print(part_one(filepath, value))
-    print(part_two(filepath, value))
+    data = parse(utils.input_path("2020/01.txt"))
+    print(part_one(data, value))
+    print(part_two(data, value))
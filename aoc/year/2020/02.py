@@ -37,7 +37,7 @@ How many passwords are valid according to the new interpretation of the policies
 
 from dataclasses import dataclass
 
-from aoc import utils
+from aoc import days, utils
 
 
 @dataclass
@@ -63,21 +63,26 @@ class Rule:
         return pos_min ^ pos_max
 
 
-def part_one_and_two(filpath):
-    sled_count = 0
-    santa_count = 0
-    for line in utils.read_lines(filepath):
+def parse(filepath):
+    entries = []
+    for line in utils.read_lines(filepath, strip=True):
         rule_part, pwd_part = line.split(":")
-        rule = Rule.from_rule_str(rule_part)
-        if rule.is_valid_password_for_sled(pwd_part.strip()):
-            sled_count += 1
-        if rule.is_valid_password_for_santa(pwd_part.strip()):
-            santa_count += 1
-    return sled_count, santa_count
+        entries.append((Rule.from_rule_str(rule_part), pwd_part.strip()))
+    return tuple(entries)
+
+
+def part_one(entries):
+    return sum(1 for rule, password in entries if rule.is_valid_password_for_sled(password))
+
+
+def part_two(entries):
+    return sum(1 for rule, password in entries if rule.is_valid_password_for_santa(password))
+
+
+DAY = days.Day("2020/02.txt", part_one, part_two, parse=parse)
 
 
 if __name__ == "__main__":
-    filepath = "2020/02.txt"
-    sled, santa = part_one_and_two(filepath)
-    print(sled)
-    print(santa)
+    entries = parse(utils.input_path("2020/02.txt"))
+    print(part_one(entries))
+    print(part_two(entries))
@@ -69,7 +69,11 @@ What do you get if you multiply together the number of trees encountered on each
 
 from functools import reduce
 
-from aoc import utils
+from aoc import days, utils
+
+
+SLOPE = (3, 1)
+SLOPES = ((1, 1), (3, 1), (5, 1), (7, 1), (1, 2))
 
 
 def is_tree(patch):
@@ -88,22 +92,34 @@ def get_index(width, line_number, slope):
     return absolute_pos % width
 
 
-def part_one(filepath, slope):
+def parse(filepath):
+    return tuple(utils.read_lines(filepath, strip=True))
+
+
+def part_one(lines, slope):
     tree_count = 0
-    for line_num, line in enumerate(utils.read_lines(filepath, strip=True)):
+    for line_num, line in enumerate(lines):
         index = get_index(len(line), line_num, slope)
         if index != -1 and is_tree(line[index]):
             tree_count += 1
     return tree_count
 
 
-def part_two(filepath, *slopes):
-    values = [part_one(filepath, slope) for slope in slopes]
+def part_two(lines, *slopes):
+    values = [part_one(lines, slope) for slope in slopes]
     total = reduce(lambda x, y: x * y, values)
     return values, total
 
 
+DAY = days.Day(
+    "2020/03.txt",
+    lambda lines: part_one(lines, SLOPE),
+    lambda lines: part_two(lines, *SLOPES)[1],
+    parse=parse,
+)
+
+
 if __name__ == "__main__":
-    filepath = "2020/03.txt"
-    print(part_one(filepath, (3, 1)))
-    print(part_two(filepath, (1, 1), (3, 1), (5, 1), (7, 1), (1, 2)))
+    lines = parse(utils.input_path("2020/03.txt"))
+    print(part_one(lines, SLOPE))
+    print(part_two(lines, *SLOPES))
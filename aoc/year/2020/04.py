@@ -112,7 +112,28 @@ Count the number of valid passports - those that have all required fields and va
 
 import re
 
-from aoc import utils
+from aoc import days, utils
+
+
+REQUIRED_FIELDS = [
+    r"\bbyr\b:",
+    r"\biyr\b:",
+    r"\beyr\b:",
+    r"\bhgt\b:",
+    r"\bhcl\b:",
+    r"\becl\b:",
+    r"\bpid\b:",
+]
+
+VALID_FIELDS = [
+    r"\bbyr\b:\b(19[2-9][0-9]|200[0-2])\b",
+    r"\biyr\b:\b(201[0-9]|2020)\b",
+    r"\beyr\b:\b(202[0-9]|2030)\b",
+    r"\bhgt\b:\b(1[5-8][0-9]cm|19[0-3]cm|59in|6[0-9]in|7[0-6]in)\b",
+    r"\bhcl\b:#\b[0-9a-f]{6}\b",
+    r"\becl\b:\b(amb|blu|brn|gry|grn|hzl|oth)\b",
+    r"\bpid\b:\b[0-9]{9}\b",
+]
 
 
 def get_regex(*rules):
@@ -121,41 +142,32 @@ def get_regex(*rules):
     return reg
 
 
-def is_valid_passpord(passport_lines, regex):
-    passport = " ".join(passport_lines)
+def is_valid_passpord(passport, regex):
     return regex.search(passport) is not None
 
 
-def part_one_and_two(filepath, rules):
+def parse(filepath):
+    return tuple(utils.read_records(filepath, " "))
+
+
+def part_one_and_two(passports, rules):
     total_valid = 0
     regex = re.compile(get_regex(*rules))
-    passport_lines = []
-    for line in utils.read_lines(filepath, strip=True):
-        if line:
-            passport_lines.append(line)
-        else:
-            total_valid += int(is_valid_passpord(passport_lines, regex))
-            passport_lines = []
-    total_valid += int(is_valid_passpord(passport_lines, regex))
+    for passport in passports:
+        total_valid += int(is_valid_passpord(passport, regex))
     return total_valid
 
 
+DAY = days.Day(
+    "2020/04.txt",
+    lambda passports: part_one_and_two(passports, REQUIRED_FIELDS),
+    lambda passports: part_one_and_two(passports, VALID_FIELDS),
+    parse=parse,
+)
+
+
 if __name__ == "__main__":
-    byr = r"\bbyr\b:"
-    iyr = r"\biyr\b:"
-    eyr = r"\beyr\b:"
-    hgt = r"\bhgt\b:"
-    hcl = r"\bhcl\b:"
-    ecl = r"\becl\b:"
-    pid = r"\bpid\b:"
-
-    byr2 = r"\bbyr\b:\b(19[2-9][0-9]|200[0-2])\b"
-    iyr2 = r"\biyr\b:\b(201[0-9]|2020)\b"
-    eyr2 = r"\beyr\b:\b(202[0-9]|2030)\b"
-    hgt2 = r"\bhgt\b:\b(1[5-8][0-9]cm|19[0-3]cm|59in|6[0-9]in|7[0-6]in)\b"
-    hcl2 = r"\bhcl\b:#\b[0-9a-f]{6}\b"
-    ecl2 = r"\becl\b:\b(amb|blu|brn|gry|grn|hzl|oth)\b"
-    pid2 = r"\bpid\b:\b[0-9]{9}\b"
-
-    print(part_one_and_two("2020/04.txt", [byr, iyr, eyr, hgt, hcl, ecl, pid]))
-    print(part_one_and_two("2020/04.txt", [byr2, iyr2, eyr2, hgt2, hcl2, ecl2, pid2]))
+    passports = parse(utils.input_path("2020/04.txt"))
+
+    print(part_one_and_two(passports, REQUIRED_FIELDS))
+    print(part_one_and_two(passports, VALID_FIELDS))
@@ -50,7 +50,7 @@ What is the ID of your seat?
 
 import math
 
-from aoc import utils
+from aoc import days, utils
 
 
 def calculate_index(seat, take_lower, take_upper, lower, upper):
@@ -74,21 +74,23 @@ def get_seat_info(pass_number):
     return row, col, (row * 8 + col)
 
 
-def part_one(filepath):
+def parse(filepath):
+    return tuple(get_seat_info(pass_number)[2] for pass_number in utils.read_lines(filepath, strip=True))
+
+
+def part_one(seat_ids):
     highest = -1
-    for pass_number in utils.read_lines(filepath, strip=True):
-        row, col, id_ = get_seat_info(pass_number)
+    for id_ in seat_ids:
         if id_ > highest:
             highest = id_
     return highest
 
 
-def part_two(filepath):
+def part_two(seat_ids):
     lowest = None
     highest = None
     total = 0
-    for pass_number in utils.read_lines(filepath, strip=True):
-        row, col, id_ = get_seat_info(pass_number)
+    for id_ in seat_ids:
         if highest is None or id_ > highest:
             highest = id_
         if lowest is None or id_ < lowest:
@@ -98,7 +100,10 @@ def part_two(filepath):
     return expected_total - total
 
 
+DAY = days.Day("2020/05.txt", part_one, part_two, parse=parse)
+
+
 if __name__ == "__main__":
-    filepath = "2020/05.txt"
-    print(part_one(filepath))
-    print(part_two(filepath))
+    seat_ids = parse(utils.input_path("2020/05.txt"))
+    print(part_one(seat_ids))
+    print(part_two(seat_ids))
@@ -76,36 +76,32 @@ For each group, count the number of questions to which everyone answered "yes".
 
 from functools import reduce
 
-from aoc import utils
+from aoc import days, utils
 
 
-def part_one(filepath):
+def parse(filepath):
+    return tuple(utils.read_records(filepath))
+
+
+def part_one(groups):
     sum = 0
-    group = ""
-    for line in utils.read_lines(filepath, strip=True):
-        if line:
-            group += line
-        else:
-            sum += len(set(char for char in group))
-            group = ""
-    sum += len(set(char for char in group))
+    for lines in groups:
+        sum += len(set(char for line in lines for char in line))
     return sum
 
 
-def part_two(filepath):
+def part_two(groups):
     sum = 0
-    group = []
-    for line in utils.read_lines(filepath, strip=True):
-        if line:
-            group.append(set(char for char in line))
-        else:
-            sum += len(reduce(lambda x, y: x.intersection(y), group))
-            group = []
-    sum += len(reduce(lambda x, y: x.intersection(y), group))
+    for lines in groups:
+        group = [set(char for char in line) for line in lines]
+        sum += len(reduce(lambda x, y: x.intersection(y), group))
     return sum
 
 
+DAY = days.Day("2020/06.txt", part_one, part_two, parse=parse)
+
+
 if __name__ == "__main__":
-    filepath = "2020/06.txt"
-    print(part_one(filepath))
-    print(part_two(filepath))
+    groups = parse(utils.input_path("2020/06.txt"))
+    print(part_one(groups))
+    print(part_two(groups))
@@ -60,7 +60,7 @@ How many individual bags are required inside your single shiny gold bag?
 
 from functools import reduce
 
-from aoc import utils
+from aoc import days, utils
 
 
 class Node:
@@ -148,10 +148,14 @@ def get_bags(line):
     return bag, bag_children
 
 
+@utils.cache_parse
+def parse(filepath):
+    return tuple(get_bags(line) for line in utils.read_lines(filepath))
+
+
 def build_graph(filepath):
     graph = DirectedGraph()
-    for line in utils.read_lines(filepath):
-        bag, children = get_bags(line)
+    for bag, children in parse(filepath):
         graph.add_node(bag)
         for child in children:
             (count, name) = child
@@ -161,19 +165,25 @@ def build_graph(filepath):
     return graph
 
 
-def part_one(filepath, name):
-    graph = build_graph(filepath)
-    unique_ancestors = graph.get_unique_ancestors("shiny gold")
+def part_one(graph, name):
+    unique_ancestors = graph.get_unique_ancestors(name)
     return len(unique_ancestors)
 
 
-def part_two(filepath, name):
-    graph = build_graph(filepath)
+def part_two(graph, name):
     return graph.get_nested_count(name)
 
 
+DAY = days.Day(
+    "2020/07.txt",
+    lambda graph: part_one(graph, "shiny gold"),
+    lambda graph: part_two(graph, "shiny gold"),
+    parse=build_graph,
+)
+
+
 if __name__ == "__main__":
-    filepath = "2020/07.txt"
+    graph = build_graph(utils.input_path("2020/07.txt"))
     name = "shiny gold"
-    print(part_one(filepath, name))
-    print(part_two(filepath, name))
+    print(part_one(graph, name))
+    print(part_two(graph, name))
@@ -80,7 +80,7 @@ Fix the program so that it terminates normally by changing exactly one jmp (to n
 
 from copy import deepcopy
 
-from aoc import utils
+from aoc import days, utils
 
 
 class InterpreterInfiniteLoopError(Exception):
@@ -142,13 +142,8 @@ class Interpreter:
                 else:
                     return env
 
-    def execute(self, filepath, attempt_fix):
+    def execute(self, lines, attempt_fix):
         env = RuntimeEnvironment()
-        lines = []
-        for line in utils.read_lines(filepath):
-            operation, argument = line.split(" ")
-            lines.append([operation, int(argument)])
-
         try:
             return self._execute(lines, env)
         except InterpreterInfiniteLoopError:
@@ -165,18 +160,29 @@ class Interpreter:
             return env.accumulator
 
 
-def part_one(filepath):
+def parse(filepath):
+    lines = []
+    for line in utils.read_lines(filepath):
+        operation, argument = line.split(" ")
+        lines.append([operation, int(argument)])
+    return lines
+
+
+def part_one(lines):
     interp = Interpreter()
-    return interp.execute(filepath, False)
+    return interp.execute(lines, False)
 
 
-def part_two(filepath):
+def part_two(lines):
     interp = Interpreter()
-    return interp.execute(filepath, True)
+    return interp.execute(lines, True)
+
+
+DAY = days.Day("2020/08.txt", part_one, part_two, parse=parse)
 
 
 if __name__ == "__main__":
-    filepath = "2020/08.txt"
-    print(part_one(filepath))
+    lines = parse(utils.input_path("2020/08.txt"))
+    print(part_one(lines))
     print("----------------")
-    print(part_two(filepath))
+    print(part_two(lines))
@@ -82,27 +82,32 @@ In this example, there are 5 sums that are larger than the previous sum.
 Consider sums of a three-measurement sliding window. How many sums are larger than the previous sum?
 
 """
-from aoc import utils
+from array import array
 
+from aoc import days, utils
 
-def window_depth_changes(filename: str, window_size: int) -> tuple:
+
+def parse(filename: str) -> array:
+    return utils.read_ints(filename)
+
+
+def window_depth_changes(depths: array, window_size: int) -> tuple:
     depth_map = []
 
     current_window_values = []
     previous = None
-    for line in utils.read_lines(filename):
-        if line:
-            current_window_values.append(int(line))
-
-            if len(current_window_values) == window_size:
-                total = sum(current_window_values)
-                if previous is None or previous == total:
-                    change = 0
-                else:
-                    change = 1 if total > previous else -1
-                depth_map.append((total, change))
-                previous = total
-                current_window_values.pop(0)
+    for depth in depths:
+        current_window_values.append(depth)
+
+        if len(current_window_values) == window_size:
+            total = sum(current_window_values)
+            if previous is None or previous == total:
+                change = 0
+            else:
+                change = 1 if total > previous else -1
+            depth_map.append((total, change))
+            previous = total
+            current_window_values.pop(0)
 
     return tuple(depth_map)
 
@@ -115,14 +120,25 @@ def count_for_value(depth_map: tuple, value: int) -> int:
     return count
 
 
+DAY = days.Day(
+    "2021/01.txt",
+    lambda depths: count_for_value(window_depth_changes(depths, 1), 1),
+    lambda depths: count_for_value(window_depth_changes(depths, 3), 1),
+    parse=parse,
+)
+
+
 if __name__ == "__main__":
     test_filename = "2021/01-test.txt"
-    filename = "2021/01.txt"
+    filename = utils.input_path("2021/01.txt")
     single_size = 1
     window_size = 3
 
-    print(f"{test_filename} (window): {count_for_value(window_depth_changes(test_filename, single_size), 1)}")
-    print(f"{filename} (window): {count_for_value(window_depth_changes(filename, single_size), 1)}")
+    test_depths = parse(test_filename)
+    depths = parse(filename)
+
+    print(f"{test_filename} (window): {count_for_value(window_depth_changes(test_depths, single_size), 1)}")
+    print(f"{filename} (window): {count_for_value(window_depth_changes(depths, single_size), 1)}")
 
-    print(f"{test_filename} (window): {count_for_value(window_depth_changes(test_filename, window_size), 1)}")
-    print(f"{filename} (window): {count_for_value(window_depth_changes(filename, window_size), 1)}")
+    print(f"{test_filename} (window): {count_for_value(window_depth_changes(test_depths, window_size), 1)}")
+    print(f"{filename} (window): {count_for_value(window_depth_changes(depths, window_size), 1)}")
@@ -64,7 +64,7 @@ Using this new interpretation of the commands, calculate the horizontal position
 from enum import Enum
 from typing import Tuple
 
-from aoc import utils
+from aoc import days, utils
 
 
 class Direction(Enum):
@@ -106,35 +106,48 @@ class AdvancedPosition(Position):
 
 
 def get_directions(filename: str) -> Tuple[Direction, int]:
-    for line in utils.read_lines(filename):
+    for line in utils.read_lines(filename, strip=True):
         direction, amount = line.split(" ")
         yield (Direction(direction), int(amount))
 
 
+def parse(filename: str) -> Tuple[Tuple[Direction, int], ...]:
+    return tuple(get_directions(filename))
+
+
+def final_position(directions: Tuple[Tuple[Direction, int], ...], position: Position) -> Position:
+    for direction, amount in directions:
+        position.move(direction, amount)
+    return position
+
+
+DAY = days.Day(
+    "2021/02.txt",
+    lambda directions: final_position(directions, Position()).combined(),
+    lambda directions: final_position(directions, AdvancedPosition()).combined(),
+    parse=parse,
+)
+
+
 if __name__ == "__main__":
     test_filename = "2021/02-test.txt"
-    filename = "2021/02.txt"
+    filename = utils.input_path("2021/02.txt")
 
-    test_position = Position()
-    for direction, amount in get_directions(test_filename):
-        test_position.move(direction, amount)
+    test_directions = parse(test_filename)
+    directions = parse(filename)
+
+    test_position = final_position(test_directions, Position())
     print(f"{test_position.x=}, {test_position.y=}")
     print(f"{test_position.combined()=}")
 
-    position = Position()
-    for direction, amount in get_directions(filename):
-        position.move(direction, amount)
+    position = final_position(directions, Position())
     print(f"{position.x=}, {position.y=}")
     print(f"{position.combined()=}")
 
-    test_ad_position = AdvancedPosition()
-    for direction, amount in get_directions(test_filename):
-        test_ad_position.move(direction, amount)
+    test_ad_position = final_position(test_directions, AdvancedPosition())
     print(f"{test_ad_position.x=}, {test_ad_position.y=}")
     print(f"{test_ad_position.combined()=}")
 
-    ad_position = AdvancedPosition()
-    for direction, amount in get_directions(filename):
-        ad_position.move(direction, amount)
+    ad_position = final_position(directions, AdvancedPosition())
     print(f"{ad_position.x=}, {ad_position.y=}")
     print(f"{ad_position.combined()=}")
@@ -72,7 +72,11 @@ Use the binary numbers in your diagnostic report to calculate the oxygen generat
 from functools import reduce
 from typing import List, Optional, Tuple
 
-from aoc import utils
+from aoc import days, utils
+
+
+def parse(filename: str) -> List[str]:
+    return [line for line in utils.read_lines(filename, True) if line]
 
 
 class Diagnostic:
@@ -150,12 +154,20 @@ class Diagnostic:
         return reduce(lambda x, y: x * y, self._get_oxygen_and_co2())
 
 
+DAY = days.Day(
+    "2021/03.txt",
+    lambda values: Diagnostic(values).get_power_consumption(),
+    lambda values: Diagnostic(values).get_life_support_rating(),
+    parse=parse,
+)
+
+
 if __name__ == "__main__":
     test_filename = "2021/03-test.txt"
-    filename = "2021/03.txt"
+    filename = utils.input_path("2021/03.txt")
 
-    test_values = [line for line in utils.read_lines(test_filename, True) if line]
-    values = [line for line in utils.read_lines(filename, True) if line]
+    test_values = parse(test_filename)
+    values = parse(filename)
 
     test_diag = Diagnostic(test_values)
     print(f"Test Power: {test_diag.get_power_consumption()}")
@@ -71,7 +71,7 @@ Figure out which board will win last. Once it wins, what would its final score b
 import operator
 from typing import Callable, Optional, Tuple
 
-from aoc import utils
+from aoc import days, utils
 
 
 class BingoBoard:
@@ -146,25 +146,15 @@ class BingoGame:
 
 
 def parser(filename: str) -> Tuple[Tuple[int, ...], Tuple[Tuple[int, ...], ...]]:
-    guesses = None
-    boards = []
-    current_board = []
-    for line in utils.read_lines(filename, True):
-        if guesses is None:
-            guesses = tuple(int(value) for value in line.split(","))
-            continue
-        if line:
-            current_board.extend([int(value) for value in line.split()])
-        elif not line and current_board:
-            boards.append(tuple(board for board in current_board))
-            current_board = []
-    boards.append(tuple(board for board in current_board))
-
-    return guesses, tuple(boards)
-
-
-def determine_winning_score(filename: str, op: Callable) -> int:
-    g, bs = parser(filename)
+    records = utils.read_records(filename, " ")
+    guesses = tuple(int(value) for value in next(records).split(","))
+    boards = tuple(tuple(int(value) for value in record.split()) for record in records)
+
+    return guesses, boards
+
+
+def determine_winning_score(game: Tuple[Tuple[int, ...], Tuple[Tuple[int, ...], ...]], op: Callable) -> int:
+    g, bs = game
     bg = BingoGame(g)
 
     best_board = None
@@ -181,12 +171,23 @@ def determine_winning_score(filename: str, op: Callable) -> int:
     return (sum(best_board.values) - sum(best_board.marked_numbers)) * winning_value
 
 
+DAY = days.Day(
+    "2021/04.txt",
+    lambda game: determine_winning_score(game, operator.lt),
+    lambda game: determine_winning_score(game, operator.gt),
+    parse=parser,
+)
+
+
 if __name__ == "__main__":
     test_filename = "2021/04-test.txt"
-    filename = "2021/04.txt"
+    filename = utils.input_path("2021/04.txt")
+
+    test_game = parser(test_filename)
+    game = parser(filename)
 
-    print(determine_winning_score(test_filename, operator.lt))
-    print(determine_winning_score(filename, operator.lt))
+    print(determine_winning_score(test_game, operator.lt))
+    print(determine_winning_score(game, operator.lt))
     print("---")
-    print(determine_winning_score(test_filename, operator.gt))
-    print(determine_winning_score(filename, operator.gt))
+    print(determine_winning_score(test_game, operator.gt))
+    print(determine_winning_score(game, operator.gt))
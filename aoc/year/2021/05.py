@@ -71,15 +71,20 @@ Consider all of the lines. At how many points do at least two lines overlap?
 """
 import os
 from collections import defaultdict
-from typing import Generator, Tuple
+from typing import Tuple
 
-from aoc import utils
+from aoc import days, utils
 
 
-def parse(filename: str) -> Generator[Tuple[Tuple[int, int], Tuple[int, int]], None, None]:
+@utils.cache_parse
+def parse(filename: str) -> Tuple[Tuple[Tuple[int, int], Tuple[int, int]], ...]:
+    lines = []
     for line in utils.read_lines(filename, True):
         start, end = [point.strip() for point in line.split("->")]
-        yield tuple([tuple(int(value) for value in start.split(",")), tuple(int(value) for value in end.split(","))])
+        lines.append(
+            tuple([tuple(int(value) for value in start.split(",")), tuple(int(value) for value in end.split(","))])
+        )
+    return tuple(lines)
 
 
 class HydrothermalMap:
@@ -143,29 +148,37 @@ class HydrothermalMap:
         return value
 
 
+def dangerous_spots(
+    lines: Tuple[Tuple[Tuple[int, int], Tuple[int, int]], ...], *, allow_diagonals: bool, threshold: int = 2
+) -> int:
+    vent_map = HydrothermalMap()
+    for start, end in lines:
+        vent_map.add_line(start, end, allow_diagonals=allow_diagonals)
+    return vent_map.number_of_dangerous_spots_for_threshold(threshold)
+
+
+DAY = days.Day(
+    "2021/05.txt",
+    lambda lines: dangerous_spots(lines, allow_diagonals=False),
+    lambda lines: dangerous_spots(lines, allow_diagonals=True),
+    parse=parse,
+)
+
+
 if __name__ == "__main__":
     test_filename = "2021/05-test.txt"
-    filename = "2021/05.txt"
+    filename = utils.input_path("2021/05.txt")
     danger_threshold = 2
 
-    test_map = HydrothermalMap()
-    for value in parse(test_filename):
-        test_map.add_line(value[0], value[1], allow_diagonals=False)
-    print(test_map.number_of_dangerous_spots_for_threshold(danger_threshold))
-    print(test_map)
-
-    test_map2 = HydrothermalMap()
-    for value in parse(test_filename):
-        test_map2.add_line(value[0], value[1], allow_diagonals=True)
-    print(test_map2.number_of_dangerous_spots_for_threshold(danger_threshold))
-    print(test_map2)
-
-    real_map = HydrothermalMap()
-    for value in parse(filename):
-        real_map.add_line(value[0], value[1], allow_diagonals=False)
-    print(real_map.number_of_dangerous_spots_for_threshold(danger_threshold))
-
-    real_map2 = HydrothermalMap()
-    for value in parse(filename):
-        real_map2.add_line(value[0], value[1], allow_diagonals=True)
-    print(real_map2.number_of_dangerous_spots_for_threshold(danger_threshold))
+    test_lines = parse(test_filename)
+    lines = parse(filename)
+
+    for allow_diagonals in (False, True):
+        test_map = HydrothermalMap()
+        for start, end in test_lines:
+            test_map.add_line(start, end, allow_diagonals=allow_diagonals)
+        print(test_map.number_of_dangerous_spots_for_threshold(danger_threshold))
+        print(test_map)
+
+    print(dangerous_spots(lines, allow_diagonals=False, threshold=danger_threshold))
+    print(dangerous_spots(lines, allow_diagonals=True, threshold=danger_threshold))
@@ -61,17 +61,16 @@ After 256 days in the example above, there would be a total of 26984457539 lante
 How many lanternfish would there be after 256 days?
 
 """
-from typing import Tuple
+from array import array
 
-from aoc import utils
+from aoc import days, utils
 
 
-def parse(filename: str) -> Tuple[int, ...]:
-    data = utils.read_file(filename)
-    return tuple(int(x) for x in data.strip().split(","))
+def parse(filename: str) -> array:
+    return utils.read_int_csv(filename)
 
 
-def simulate_lanternfish(fishes: Tuple[int, ...], days: int) -> int:
+def simulate_lanternfish(fishes: array, days: int) -> int:
     NEW_REPRO_RATE = 8
     OLD_REPRO_RATE = 6
 
@@ -99,24 +98,35 @@ def simulate_lanternfish(fishes: Tuple[int, ...], days: int) -> int:
     return count
 
 
+DAY = days.Day(
+    "2021/06.txt",
+    lambda fishes: simulate_lanternfish(fishes, 80),
+    lambda fishes: simulate_lanternfish(fishes, 256),
+    parse=parse,
+)
+
+
 if __name__ == "__main__":
     test_filename = "2021/06-test.txt"
-    filename = "2021/06.txt"
+    filename = utils.input_path("2021/06.txt")
 
     days_18 = 18
     days_80 = 80
     days_256 = 256
 
-    test_sim_18 = simulate_lanternfish(parse(test_filename), days_18)
-    test_sim_80 = simulate_lanternfish(parse(test_filename), days_80)
-    test_sim_256 = simulate_lanternfish(parse(test_filename), days_256)
+    test_fishes = parse(test_filename)
+    fishes = parse(filename)
+
+    test_sim_18 = simulate_lanternfish(test_fishes, days_18)
+    test_sim_80 = simulate_lanternfish(test_fishes, days_80)
+    test_sim_256 = simulate_lanternfish(test_fishes, days_256)
     print(f"{days_18} test: {test_sim_18}")
     print(f"{days_80} test: {test_sim_80}")
     print(f"{days_256} test: {test_sim_256}")
 
-    sim_18 = simulate_lanternfish(parse(filename), days_18)
-    sim_80 = simulate_lanternfish(parse(filename), days_80)
-    sim_256 = simulate_lanternfish(parse(filename), days_256)
+    sim_18 = simulate_lanternfish(fishes, days_18)
+    sim_80 = simulate_lanternfish(fishes, days_80)
+    sim_256 = simulate_lanternfish(fishes, days_256)
     print(f"{days_18}: {sim_18}")
     print(f"{days_80}: {sim_80}")
     print(f"{days_256}: {sim_256}")
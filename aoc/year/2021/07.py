@@ -65,20 +65,17 @@ Determine the horizontal position that the crabs can align to using the least fu
 95167367 -- too high
 """
 import statistics
-from typing import Tuple
+from array import array
 
-from aoc import utils
+from aoc import days, utils
 
 
-def parse(filename: str) -> Tuple[int, ...]:
-    data = utils.read_file(filename)
-    return tuple(int(x) for x in data.strip().split(","))
+def parse(filename: str) -> array:
+    return utils.read_int_csv(filename)
 
 
-def calculate_fuel_simple(filename: str) -> int:
+def calculate_fuel_simple(crabs: array) -> int:
     position = 0
-    crabs = parse(filename)
-
     crabs = sorted(list(crabs))
     position = int(statistics.median(crabs))
 
@@ -88,10 +85,8 @@ def calculate_fuel_simple(filename: str) -> int:
     return fuel
 
 
-def calculate_fuel_complex(filename: str) -> int:
+def calculate_fuel_complex(crabs: array) -> int:
     position = 0
-    crabs = parse(filename)
-
     avg = statistics.mean(crabs)
     avg_low = int(avg)
     avg_high = int(avg + 1)
@@ -103,12 +98,18 @@ def calculate_fuel_complex(filename: str) -> int:
     return fuel_high if fuel_high < fuel_low else fuel_low
 
 
+DAY = days.Day("2021/07.txt", calculate_fuel_simple, calculate_fuel_complex, parse=parse)
+
+
 if __name__ == "__main__":
     test_filename = "2021/07-test.txt"
-    filename = "2021/07.txt"
+    filename = utils.input_path("2021/07.txt")
+
+    test_crabs = parse(test_filename)
+    crabs = parse(filename)
 
-    print(calculate_fuel_simple(test_filename))
-    print(calculate_fuel_simple(filename))
+    print(calculate_fuel_simple(test_crabs))
+    print(calculate_fuel_simple(crabs))
 
-    print(calculate_fuel_complex(test_filename))
-    print(calculate_fuel_complex(filename))
+    print(calculate_fuel_complex(test_crabs))
+    print(calculate_fuel_complex(crabs))
@@ -135,7 +135,7 @@ from collections import defaultdict
 from functools import reduce
 from typing import List
 
-from aoc import utils
+from aoc import days, utils
 
 
 class Display:
@@ -247,32 +247,35 @@ def get_displays(filename: str) -> List[Display]:
     return displays
 
 
-def calculate_easy_output(filename: str) -> int:
+def calculate_easy_output(displays: List[Display]) -> int:
     easy_numbers = [1, 4, 7, 8]
-    displays = get_displays(filename)
 
     output_total = 0
     for display in displays:
         for number in easy_numbers:
             output_total += display.get_output_count(number)
-    print(output_total)
-
+    return output_total
 
-def calculate_display_output(filename: str) -> int:
-    displays = get_displays(filename)
 
+def calculate_display_output(displays: List[Display]) -> int:
     total = 0
     for display in displays:
         total += int("".join([str(x) for x in display.correct_display_output]))
-    print(total)
+    return total
+
+
+DAY = days.Day("2021/08.txt", calculate_easy_output, calculate_display_output, parse=get_displays)
 
 
 if __name__ == "__main__":
     test_filename = "2021/08-test.txt"
-    filename = "2021/08.txt"
+    filename = utils.input_path("2021/08.txt")
+
+    test_displays = get_displays(test_filename)
+    displays = get_displays(filename)
 
-    calculate_easy_output(test_filename)
-    calculate_easy_output(filename)
+    print(calculate_easy_output(test_displays))
+    print(calculate_easy_output(displays))
 
-    calculate_display_output(test_filename)
-    calculate_display_output(filename)
+    print(calculate_display_output(test_displays))
+    print(calculate_display_output(displays))
@@ -73,15 +73,11 @@ from functools import reduce
 from math import sqrt
 from typing import List, Tuple
 
-from aoc import utils
+from aoc import days, utils
 
 
-def parse(filename: str) -> Tuple[List[int], int]:
-    values = []
-    width = -1
-    for line in utils.read_lines(filename, True):
-        values.extend([int(value) for value in line])
-        width = len(line)
+def parse(filename: str) -> Tuple[bytearray, int]:
+    values, width, _ = utils.read_digit_grid(filename)
     return values, width
 
 
@@ -93,7 +89,7 @@ class Direction(Enum):
 
 
 class VentMap:
-    def __init__(self, vent_map: List[int], width: int) -> None:
+    def __init__(self, vent_map: bytearray, width: int) -> None:
         self.vent_map = vent_map
         self._width = width
         self._height = int(len(vent_map) / width)
@@ -167,22 +163,30 @@ class VentMap:
         return tuple(self._calculate_basin(point, []) for point in self.low_points)
 
 
-def calculate_map_low_points(filename: str) -> None:
-    vent_map = VentMap(*parse(filename))
-    print(sum([vent_map.vent_map[idx] + 1 for idx in vent_map.low_points]))
+def parse_map(filename: str) -> VentMap:
+    return VentMap(*parse(filename))
 
 
-def calculate_map_basins(filename: str) -> None:
-    vent_map = VentMap(*parse(filename))
-    print(reduce(lambda x, y: x * y, sorted([len(basin) for basin in vent_map.calculate_basins()], reverse=True)[0:3]))
+def calculate_map_low_points(vent_map: VentMap) -> int:
+    return sum([vent_map.vent_map[idx] + 1 for idx in vent_map.low_points])
+
+
+def calculate_map_basins(vent_map: VentMap) -> int:
+    return reduce(lambda x, y: x * y, sorted([len(basin) for basin in vent_map.calculate_basins()], reverse=True)[0:3])
+
+
+DAY = days.Day("2021/09.txt", calculate_map_low_points, calculate_map_basins, parse=parse_map)
 
 
 if __name__ == "__main__":
     test_filename = "2021/09-test.txt"
-    filename = "2021/09.txt"
+    filename = utils.input_path("2021/09.txt")
+
+    test_vent_map = parse_map(test_filename)
+    vent_map = parse_map(filename)
 
-    calculate_map_low_points(test_filename)
-    calculate_map_low_points(filename)
+    print(calculate_map_low_points(test_vent_map))
+    print(calculate_map_low_points(vent_map))
 
-    calculate_map_basins(test_filename)
-    calculate_map_basins(filename)
+    print(calculate_map_basins(test_vent_map))
+    print(calculate_map_basins(vent_map))
@@ -101,9 +101,9 @@ Find the completion string for each incomplete line, score the completion string
 
 """
 from enum import Enum
-from typing import List
+from typing import List, Tuple
 
-from aoc import utils
+from aoc import days, utils
 
 
 class LineStatus(Enum):
@@ -211,9 +211,13 @@ class SyntaxChecker:
             self._autocomplete_characters.append(close)
 
 
-def syntax_score(filename: str) -> None:
+def parse(filename: str) -> Tuple[str, ...]:
+    return tuple(utils.read_lines(filename, True))
+
+
+def syntax_score(lines: Tuple[str, ...]) -> int:
     checkers = []
-    for line in utils.read_lines(filename, True):
+    for line in lines:
         checkers.append(SyntaxChecker(line))
 
     total = 0
@@ -221,12 +225,12 @@ def syntax_score(filename: str) -> None:
         checker.process()
         if checker.line_status == LineStatus.corrupted:
             total += checker.illegal_character_score
-    print(total)
+    return total
 
 
-def autocomplete_score(filename: str) -> None:
+def autocomplete_score(lines: Tuple[str, ...]) -> int:
     checkers = []
-    for line in utils.read_lines(filename, True):
+    for line in lines:
         checkers.append(SyntaxChecker(line))
 
     scores = []
@@ -236,15 +240,21 @@ def autocomplete_score(filename: str) -> None:
             scores.append(checker.autocomplete_score)
 
     scores.sort()
-    print(scores[int(len(scores) / 2)])
+    return scores[int(len(scores) / 2)]
+
+
+DAY = days.Day("2021/10.txt", syntax_score, autocomplete_score, parse=parse)
 
 
 if __name__ == "__main__":
     test_filename = "2021/10-test.txt"
-    filename = "2021/10.txt"
+    filename = utils.input_path("2021/10.txt")
+
+    test_lines = parse(test_filename)
+    lines = parse(filename)
 
-    syntax_score(test_filename)
-    syntax_score(filename)
+    print(syntax_score(test_lines))
+    print(syntax_score(lines))
 
-    autocomplete_score(test_filename)
-    autocomplete_score(filename)
+    print(autocomplete_score(test_lines))
+    print(autocomplete_score(lines))
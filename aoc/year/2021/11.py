@@ -346,16 +346,12 @@ If you can calculate the exact moments when the octopuses will all flash simulta
 import os
 from typing import List, Tuple
 
-from aoc import utils
+from aoc import days, utils
 
 
-def parse(filename: str) -> List[int]:
-    octopi = []
-
-    for line in utils.read_lines(filename, True):
-        octopi.extend([int(n) for n in line])
-
-    return octopi
+def parse(filename: str) -> Tuple[bytearray, int]:
+    octopi, width, _ = utils.read_digit_grid(filename)
+    return octopi, width
 
 
 class Octopus:
@@ -435,35 +431,49 @@ class OctopiNetwork:
         return outp
 
 
-def calculate_step(filename: str, width: int, steps: int) -> None:
-    octopi = [Octopus(n) for n in parse(filename)]
+def calculate_step(grid: Tuple[bytearray, int], steps: int, verbose: bool = False) -> Tuple[int, int]:
+    energy_levels, width = grid
+    octopi = [Octopus(n) for n in energy_levels]
     network = OctopiNetwork(octopi, width)
 
-    print("-" * 80)
-    print(f"Before{os.linesep}{network}{os.linesep}")
+    if verbose:
+        print("-" * 80)
+        print(f"Before{os.linesep}{network}{os.linesep}")
 
     first_sync = -1
+    flashes_after_steps = -1
     step_count = 0
-    while first_sync == -1:
+    while first_sync == -1 or step_count < steps:
         step_count += 1
         flash_count = network.step()
         if step_count == steps:
-            print(f"After {steps} steps")
-            print(network)
-            print(f"Flash count: {network.reset_count}")
+            flashes_after_steps = network.reset_count
+            if verbose:
+                print(f"After {steps} steps")
+                print(network)
+                print(f"Flash count: {network.reset_count}")
         if flash_count == len(octopi) and first_sync == -1:
             first_sync = step_count
 
-    print(f"First Sync: {first_sync}")
-    print("-" * 80 + os.linesep)
+    if verbose:
+        print(f"First Sync: {first_sync}")
+        print("-" * 80 + os.linesep)
+    return flashes_after_steps, first_sync
+
+
+DAY = days.Day(
+    "2021/11.txt",
+    lambda grid: calculate_step(grid, 100)[0],
+    lambda grid: calculate_step(grid, 100)[1],
+    parse=parse,
+)
 
 
 if __name__ == "__main__":
     test_filename = "2021/11-test.txt"
-    filename = "2021/11.txt"
+    filename = utils.input_path("2021/11.txt")
 
-    width = 10
     step_count = 100
 
-    calculate_step(test_filename, width, step_count)
-    calculate_step(filename, width, step_count)
+    calculate_step(parse(test_filename), step_count, verbose=True)
+    calculate_step(parse(filename), step_count, verbose=True)
@@ -152,7 +152,7 @@ from copy import deepcopy
 from enum import Enum
 from typing import Any, Dict, List, Set, Tuple
 
-from aoc import utils
+from aoc import days, utils
 
 
 class CaveType(Enum):
@@ -247,20 +247,34 @@ def parse(filename: str):
         yield Cave(start), Cave(end)
 
 
-def calculate_valid_paths(filename: str, limit: int) -> None:
+def parse_network(filename: str) -> CaveNetwork:
     network = CaveNetwork()
     for start, end in parse(filename):
         network.add_edge(start, end)
+    return network
 
-    print(len(network.valid_paths(limit)))
+
+def calculate_valid_paths(network: CaveNetwork, limit: int) -> int:
+    return len(network.valid_paths(limit))
+
+
+DAY = days.Day(
+    "2021/12.txt",
+    lambda network: calculate_valid_paths(network, 1),
+    lambda network: calculate_valid_paths(network, 2),
+    parse=parse_network,
+)
 
 
 if __name__ == "__main__":
     test_filename = "2021/12-test.txt"
-    filename = "2021/12.txt"
+    filename = utils.input_path("2021/12.txt")
+
+    test_network = parse_network(test_filename)
+    network = parse_network(filename)
 
-    calculate_valid_paths(test_filename, 1)
-    calculate_valid_paths(filename, 1)
+    print(calculate_valid_paths(test_network, 1))
+    print(calculate_valid_paths(network, 1))
 
-    calculate_valid_paths(test_filename, 2)
-    calculate_valid_paths(filename, 2)
+    print(calculate_valid_paths(test_network, 2))
+    print(calculate_valid_paths(network, 2))
@@ -116,12 +116,15 @@ Finish folding the transparent paper according to the instructions. The manual s
 
 What code do you use to activate the infrared thermal imaging camera system?
 """
+import os
 from collections import defaultdict
-from aoc import utils
+from typing import Iterable
+
+from aoc import days, utils
 
 
 class Origami:
-    def __init__(self, filename: str) -> None:
+    def __init__(self, lines: Iterable[str]) -> None:
         self.width = 0
         self.height = 0
 
@@ -129,7 +132,7 @@ class Origami:
         self._by_col = defaultdict(set)
         self._instructions = []
 
-        for line in utils.read_lines(filename, True):
+        for line in lines:
             if line:
                 parts = line.split(",")
                 if len(parts) == 2:
@@ -179,35 +182,45 @@ class Origami:
         return self._fold(self._by_row, self._by_col, 0, fold_count)
 
 
-def visible_dots_one_fold(filename: str) -> None:
-    origami = Origami(filename)
+def parse(filename: str) -> Origami:
+    return Origami(utils.read_lines(filename, True))
+
+
+def visible_dots_one_fold(origami: Origami) -> int:
     folded = origami.fold(1)
 
     count = 0
     for points in folded.values():
         count += len(points)
-    print(count)
+    return count
 
 
-def get_code(filename: str) -> None:
-    origami = Origami(filename)
+def get_code(origami: Origami) -> str:
     folded = origami.fold(-1)
 
+    lines = []
     height = max(folded.keys()) + 1
     for row in range(height):
         line = ""
         width = max(folded[row]) + 1
         for col in range(width):
             line += "#" if col in folded[row] else "."
-        print(line)
+        lines.append(line)
+    return os.linesep.join(lines)
+
+
+DAY = days.Day("2021/13.txt", visible_dots_one_fold, get_code, parse=parse)
 
 
 if __name__ == "__main__":
     test_filename = "2021/13-test.txt"
-    filename = "2021/13.txt"
+    filename = utils.input_path("2021/13.txt")
+
+    test_origami = parse(test_filename)
+    origami = parse(filename)
 
-    visible_dots_one_fold(test_filename)
-    get_code(test_filename)
+    print(visible_dots_one_fold(test_origami))
+    print(get_code(test_origami))
 
-    visible_dots_one_fold(filename)
-    get_code(filename)
+    print(visible_dots_one_fold(origami))
+    print(get_code(origami))
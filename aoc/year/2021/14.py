@@ -64,7 +64,7 @@ Apply 40 steps of pair insertion to the polymer template and find the most and l
 from collections import defaultdict
 from typing import Dict, Tuple
 
-from aoc import utils
+from aoc import days, utils
 
 
 def parse(filename: str) -> Tuple[str, Dict[str, str]]:
@@ -113,24 +113,37 @@ class Polymerization:
         return elements
 
 
-def calcumate_element_spread(filename: str, steps: int) -> None:
-    template, pairs = parse(filename)
-    poly = Polymerization(template, pairs)
+def parse_polymerization(filename: str) -> Polymerization:
+    return Polymerization(*parse(filename))
+
+
+def calcumate_element_spread(poly: Polymerization, steps: int) -> int:
     elements = poly.formulate(steps)
 
     most = max(elements.values())
     least = min(elements.values())
-    print(most - least)
+    return most - least
+
+
+DAY = days.Day(
+    "2021/14.txt",
+    lambda poly: calcumate_element_spread(poly, 10),
+    lambda poly: calcumate_element_spread(poly, 40),
+    parse=parse_polymerization,
+)
 
 
 if __name__ == "__main__":
     test_filename = "2021/14-test.txt"
-    filename = "2021/14.txt"
+    filename = utils.input_path("2021/14.txt")
     steps_part_one = 10
     steps_part_two = 40
 
-    calcumate_element_spread(test_filename, steps_part_one)
-    calcumate_element_spread(filename, steps_part_one)
+    test_poly = parse_polymerization(test_filename)
+    poly = parse_polymerization(filename)
+
+    print(calcumate_element_spread(test_poly, steps_part_one))
+    print(calcumate_element_spread(poly, steps_part_one))
 
-    calcumate_element_spread(test_filename, steps_part_two)
-    calcumate_element_spread(filename, steps_part_two)
+    print(calcumate_element_spread(test_poly, steps_part_two))
+    print(calcumate_element_spread(poly, steps_part_two))
@@ -39,17 +39,11 @@ What is the lowest total risk of any path from the top left to the bottom right?
 """
 from typing import Any, Optional
 
-from aoc import utils
+from aoc import days, utils
 
 
-Matrix = tuple[tuple[int, ...], ...]
-
-
-def parse(filename: str) -> Matrix:
-    data = []
-    for line in utils.read_lines(filename, True):
-        data.append(tuple(int(x) for x in line))
-    return tuple(data)
+def parse(filename: str) -> tuple[bytearray, int, int]:
+    return utils.read_digit_grid(filename)
 
 
 def one_to_two(index: int, width: int) -> tuple[int, int]:
@@ -95,17 +89,19 @@ class Node:
 
 
 class Cave:
-    def __init__(self, matrix: Matrix) -> None:
-        self._matrix = matrix
+    def __init__(self, grid: bytearray, width: int, height: int) -> None:
+        self._grid = grid
+        self._width = width
+        self._height = height
 
     def _create_node(self, index: tuple[int, int], width) -> Node:
-        row = int(index[0] / len(self._matrix))
-        col = int(index[1] / len(self._matrix[0]))
+        row = int(index[0] / self._height)
+        col = int(index[1] / self._width)
 
-        matrix_position_row = index[0] - (len(self._matrix) * row)
-        matrix_position_col = index[1] - (len(self._matrix[0]) * col)
+        grid_position_row = index[0] - (self._height * row)
+        grid_position_col = index[1] - (self._width * col)
 
-        value = self._matrix[matrix_position_row][matrix_position_col] + row + col
+        value = self._grid[grid_position_row * self._width + grid_position_col] + row + col
         if value > 9:
             value = value % 9
 
@@ -153,30 +149,41 @@ class Cave:
         return all_nodes[len(all_nodes) - 1].distance_from_start
 
     def shortest_distance(self) -> int:
-        return self._shortest_distance(len(self._matrix[0]), len(self._matrix))
+        return self._shortest_distance(self._width, self._height)
 
     def shortest_distance_repeat(self, repeat: int) -> int:
-        return self._shortest_distance(len(self._matrix[0]) * repeat, len(self._matrix) * repeat)
+        return self._shortest_distance(self._width * repeat, self._height * repeat)
+
+
+def parse_cave(filename: str) -> Cave:
+    return Cave(*parse(filename))
 
 
-def shortest_distance(filename: str) -> None:
-    data = parse(filename)
-    cave = Cave(data)
-    print(cave.shortest_distance())
+def shortest_distance(cave: Cave) -> int:
+    return cave.shortest_distance()
 
 
-def shortest_distance_repeat(filename: str, repeat: int) -> None:
-    data = parse(filename)
-    cave = Cave(data)
-    print(cave.shortest_distance_repeat(repeat))
+def shortest_distance_repeat(cave: Cave, repeat: int) -> int:
+    return cave.shortest_distance_repeat(repeat)
+
+
+DAY = days.Day(
+    "2021/15.txt",
+    shortest_distance,
+    lambda cave: shortest_distance_repeat(cave, 5),
+    parse=parse_cave,
+)
 
 
 if __name__ == "__main__":
     test_filename = "2021/15-test.txt"
-    filename = "2021/15.txt"
+    filename = utils.input_path("2021/15.txt")
     repeat = 5
 
-    shortest_distance(test_filename)
-    shortest_distance(filename)
-    shortest_distance_repeat(test_filename, repeat)
-    shortest_distance_repeat(filename, repeat)
+    test_cave = parse_cave(test_filename)
+    cave = parse_cave(filename)
+
+    print(shortest_distance(test_cave))
+    print(shortest_distance(cave))
+    print(shortest_distance_repeat(test_cave, repeat))
+    print(shortest_distance_repeat(cave, repeat))